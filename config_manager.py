@@ -1,6 +1,172 @@
 import json
 import yaml
 import os
+from dataclasses import dataclass, fields
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+def _check_field_types(record) -> None:
+    """Raise TypeError for fields whose value doesn't match the annotation (ints are accepted as floats)."""
+    for f in fields(record):
+        value = getattr(record, f.name)
+        if f.type is float:
+            ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+        elif f.type is int:
+            ok = isinstance(value, int) and not isinstance(value, bool)
+        else:
+            ok = isinstance(value, f.type)
+        if not ok:
+            raise TypeError(f"Config '{f.name}' must be {f.type.__name__}, got {value!r}")
+
+
+def _check_positive(record, *names) -> None:
+    """Raise ValueError unless every named field is > 0."""
+    for name in names:
+        if getattr(record, name) <= 0:
+            raise ValueError(f"Config '{name}' must be a positive number")
+
+
+@dataclass(frozen=True, slots=True)
+class GridConfig:
+    """Validated 'grid' section; defaults match the YAML template (percentages as in the YAML)."""
+    grid_range_pct: float = 2.5
+    grid_spacing_pct: float = 0.5
+    levels: int = 10
+    capital_per_grid_pct: float = 10.0
+    total_capital_usage_pct: float = 100.0
+    trailing_enabled: bool = True
+    trailing_direction: str = 'both'
+    trailing_threshold_pct: float = 0.75
+    trailing_ma_period: int = 20
+    rebalance_threshold_pct: float = 2.0
+    auto_rebalance: bool = True
+    
+    def __post_init__(self):
+        _check_field_types(self)
+        _check_positive(self, 'grid_range_pct', 'grid_spacing_pct', 'levels', 'capital_per_grid_pct',
+                        'total_capital_usage_pct', 'trailing_threshold_pct', 'trailing_ma_period')
+        if self.trailing_direction not in ('up', 'down', 'both'):
+            raise ValueError("Grid 'trailing_direction' must be 'up', 'down' or 'both'")
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingConfig:
+    """Validated 'logging' section; defaults match the YAML template."""
+    main_log_level: str = 'INFO'
+    console_log_level: str = 'INFO'
+    log_directory: str = 'logs'
+    max_log_size_mb: int = 50
+    backup_count: int = 5
+    enable_email_alerts: bool = False
+    alert_on_profit_milestone: bool = True
+    alert_on_risk_events: bool = True
+    create_performance_charts: bool = True
+    export_trades_csv: bool = True
+    real_time_monitoring: bool = True
+    log_signals: bool = True
+    event_csv_realtime: bool = False
+    
+    def __post_init__(self):
+        _check_field_types(self)
+        _check_positive(self, 'max_log_size_mb')
+        if self.backup_count < 0:
+            raise ValueError("Logging 'backup_count' must not be negative")
+
+
+@dataclass(frozen=True, slots=True)
+class PerformanceConfig:
+    """Validated 'performance' section; defaults match the YAML template."""
+    target_profit_per_cycle_pct: float = 0.35
+    daily_target_cycles: int = 12
+    daily_target_profit_pct: float = 4.375
+    monthly_target_profit_pct: float = 96.25
+    track_cycles: bool = True
+    log_performance: bool = True
+    save_trades: bool = True
+    history_window: int = 10_000
+    
+    def __post_init__(self):
+        _check_field_types(self)
+        _check_positive(self, 'history_window')
+        if self.daily_target_cycles < 0:
+            raise ValueError("Performance 'daily_target_cycles' must not be negative")
+
+
+def _section_record(record_cls, section: dict):
+    """Build a frozen config record from a section dict, ignoring keys the record doesn't define."""
+    return record_cls(**{f.name: section[f.name] for f in fields(record_cls) if f.name in section})
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(data, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes (orjson when available)."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+
+def _json_roundtrips(value) -> bool:
+    """True when JSON hands value back unchanged (str keys only; no dates, sets or other YAML types)."""
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _json_roundtrips(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(_json_roundtrips(v) for v in value)
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _load_yaml_cached(config_path: str) -> dict:
+    """
+    Load a YAML config, reusing a JSON sidecar in .cache/ when it was written for
+    exactly this YAML file (same st_mtime_ns and st_size). The sidecar is rewritten
+    whenever YAML is parsed; configs JSON can't round-trip are never cached.
+    """
+    config_dir, config_name = os.path.split(os.path.abspath(config_path))
+    cache_path = os.path.join(config_dir, '.cache', f"{config_name}.json")
+
+    st = os.stat(config_path)
+    source = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = _json_loads(f.read())
+        if cached.get('source') == source:
+            return cached['config']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # No usable cache - fall back to parsing the YAML
+
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    if not _json_roundtrips(config):
+        return config
+
+    temp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            f.write(_json_dumps({'source': source, 'config': config}))
+        os.replace(temp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Caching is best-effort (e.g. read-only dir); don't leave a partial sidecar behind
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+    return config
 
 
 class ConfigManager:
@@ -12,6 +178,11 @@ class ConfigManager:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.config = {}
+        self._sections = {}
+        self.grid = GridConfig()
+        self.logging = LoggingConfig()
+        self.performance = PerformanceConfig()
+        self.dirty = False  # Runtime updates not yet written back to the file
         self.load_config()
         self.validate_parameters()
 
@@ -23,13 +194,26 @@ class ConfigManager:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
         ext = os.path.splitext(self.config_path)[1].lower()
-        with open(self.config_path, 'r') as f:
-            if ext in ('.yaml', '.yml'):
-                self.config = yaml.safe_load(f)
-            elif ext == '.json':
-                self.config = json.load(f)
-            else:
-                raise ValueError("Unsupported config format. Use .json, .yaml, or .yml")
+        if ext in ('.yaml', '.yml'):
+            self.config = _load_yaml_cached(self.config_path)
+        elif ext == '.json':
+            with open(self.config_path, 'rb') as f:
+                self.config = _json_loads(f.read())
+        else:
+            raise ValueError("Unsupported config format. Use .json, .yaml, or .yml")
+
+        # Section dicts resolved once; get_*_config() return these references
+        self._sections = {
+            section: self.config.get(section, {})
+            for section in ('api', 'grid', 'risk', 'trading', 'performance', 'fees', 'advanced', 'logging')
+        }
+        self._build_records()
+
+    def _build_records(self):
+        """(Re)build the frozen section records from the current config."""
+        self.grid = _section_record(GridConfig, self._sections['grid'])
+        self.logging = _section_record(LoggingConfig, self._sections['logging'])
+        self.performance = _section_record(PerformanceConfig, self._sections['performance'])
 
     def validate_parameters(self):
         """
@@ -68,51 +252,71 @@ class ConfigManager:
 
     def get_api_config(self) -> dict:
         """Return API configuration: keys, endpoints, etc."""
-        return self.config.get('api', {})
+        return self._sections['api']
 
     def get_grid_config(self) -> dict:
         """Return grid generation parameters."""
-        return self.config.get('grid', {})
+        return self._sections['grid']
 
     def get_risk_config(self) -> dict:
         """Return risk management parameters."""
-        return self.config.get('risk', {})
+        return self._sections['risk']
 
     def get_trading_config(self) -> dict:
         """Return trading execution parameters."""
-        return self.config.get('trading', {})
+        return self._sections['trading']
     
     def get_performance_config(self) -> dict:
         """Return performance tracking parameters."""
-        return self.config.get('performance', {})
+        return self._sections['performance']
     
     def get_fees_config(self) -> dict:
         """Return fee structure and optimization parameters."""
-        return self.config.get('fees', {})
+        return self._sections['fees']
     
     def get_advanced_config(self) -> dict:
         """Return advanced configuration parameters."""
-        return self.config.get('advanced', {})
+        return self._sections['advanced']
     
     def get_logging_config(self) -> dict:
         """Return logging and monitoring parameters."""
-        return self.config.get('logging', {})
+        return self._sections['logging']
 
-    def update_runtime_config(self, section: str, key: str, value):
+    def update_runtime_config(self, section: str, key: str, value, flush: bool = True):
         """
         Dynamically update a config value at runtime and persist if needed.
+        Pass flush=False to batch several updates, then call save() once.
         """
         if section not in self.config:
             raise KeyError(f"Unknown config section: {section}")
-        self.config[section][key] = value
-
-        # Optionally, write back to file
-        ext = os.path.splitext(self.config_path)[1].lower()
-        with open(self.config_path, 'w') as f:
-            if ext in ('.yaml', '.yml'):
-                yaml.safe_dump(self.config, f)
+        section_cfg = self.config[section]
+        missing = object()
+        previous = section_cfg.get(key, missing)
+        section_cfg[key] = value
+        try:
+            self._build_records()
+        except (TypeError, ValueError):
+            # Rejected by a config record's checks; keep the previous value
+            if previous is missing:
+                del section_cfg[key]
             else:
-                json.dump(self.config, f, indent=2)
-      
-    
+                section_cfg[key] = previous
+            raise
+        self.dirty = True
+
+        if flush:
+            self.save()
 
+    def save(self):
+        """Write the current config back to its file if there are unsaved updates."""
+        if not self.dirty:
+            return
+
+        ext = os.path.splitext(self.config_path)[1].lower()
+        if ext in ('.yaml', '.yml'):
+            with open(self.config_path, 'w') as f:
+                yaml.dump(self.config, f, Dumper=SafeDumper)
+        else:
+            with open(self.config_path, 'wb') as f:
+                f.write(_json_dumps(self.config, indent=True))
+        self.dirty = False
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 import requests
 import time
 
+from kline_frames import klines_to_dataframe
+
 def get_binance_data(symbol="BTCUSDT", interval="5m", start_date="2023-01-01", end_date=None):
     """
     Get historical data from Binance API directly
@@ -58,29 +60,8 @@ def get_binance_data(symbol="BTCUSDT", interval="5m", start_date="2023-01-01", e
                 break
         
         if all_data:
-            # Convert to DataFrame
-            df = pd.DataFrame(all_data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'count', 'taker_buy_volume',
-                'taker_buy_quote_volume', 'ignore'
-            ])
-            
-            # Convert to proper types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col])
-            
-            # Set timestamp as index and rename columns for backtesting compatibility
-            df.set_index('timestamp', inplace=True)
-            df.rename(columns={
-                'open': 'Open',
-                'high': 'High', 
-                'low': 'Low',
-                'close': 'Close',
-                'volume': 'Volume'
-            }, inplace=True)
-            
-            df = df[['Open', 'High', 'Low', 'Close', 'Volume']]
+            # Column names capitalized for backtesting compatibility
+            df = klines_to_dataframe(all_data, capitalize=True)
             
             print(f"✅ Binance data fetched: {len(df)} candles")
             print(f"📅 Period: {df.index[0]} to {df.index[-1]}")
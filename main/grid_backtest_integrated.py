@@ -48,6 +48,7 @@ from analytics.technical_indicators import TechnicalIndicators
 from analytics.volume_filter import VolumeFilter
 from analytics.fee_calculator import FeeCalculator
 from analytics.cycle_tracker import CycleTracker
+from kline_frames import klines_to_dataframe
 
 
 def get_btc_data_binance(symbol="BTCUSDT", interval="5m", days_back=30):
@@ -99,29 +100,8 @@ def get_btc_data_binance(symbol="BTCUSDT", interval="5m", days_back=30):
                 break
         
         if all_data:
-            # Convert to DataFrame
-            df = pd.DataFrame(all_data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'count', 'taker_buy_volume',
-                'taker_buy_quote_volume', 'ignore'
-            ])
-            
-            # Convert to proper types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col])
-            
-            # Set timestamp as index and rename columns for backtesting compatibility
-            df.set_index('timestamp', inplace=True)
-            df.rename(columns={
-                'open': 'Open',
-                'high': 'High', 
-                'low': 'Low',
-                'close': 'Close',
-                'volume': 'Volume'
-            }, inplace=True)
-            
-            df = df[['Open', 'High', 'Low', 'Close', 'Volume']]
+            # Column names capitalized for backtesting compatibility
+            df = klines_to_dataframe(all_data, capitalize=True)
             
             print(f"✅ Binance data fetched: {len(df)} candles")
             print(f"📅 Period: {df.index[0]} to {df.index[-1]}")
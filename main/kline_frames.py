@@ -0,0 +1,20 @@
+"""
+Shared conversion of raw Binance kline rows into OHLCV DataFrames for the main scripts.
+"""
+import numpy as np
+import pandas as pd
+
+
+def klines_to_dataframe(klines, capitalize: bool = False) -> pd.DataFrame:
+    """
+    Build an OHLCV DataFrame indexed by open time ('timestamp') from kline rows.
+    Kline fields 0-5 are open time (ms) and OHLCV strings; they are converted as whole
+    columns instead of per-column to_numeric on object data.
+    capitalize=True names the columns Open/High/Low/Close/Volume (backtesting compatibility).
+    """
+    bars = np.asarray(klines, dtype=object)
+    index = pd.DatetimeIndex(pd.to_datetime(bars[:, 0].astype(np.int64), unit='ms'), name='timestamp')
+    columns = ['open', 'high', 'low', 'close', 'volume']
+    if capitalize:
+        columns = [name.capitalize() for name in columns]
+    return pd.DataFrame(bars[:, 1:6].astype(np.float64), index=index, columns=columns)
@@ -25,6 +25,7 @@ from position.position_manager import PositionManager
 from strategy.strategy_state import StrategyState
 from strategy.risk_manager import RiskManager
 from strategy.grid_strategy_controller import GridStrategyController
+from kline_frames import klines_to_dataframe
 
 
 def load_testnet_keys():
@@ -156,15 +157,7 @@ def main():
         try:
             # Get last 50 5-minute candles for volatility calculation
             klines = client.get_klines(symbol='BTCUSDT', interval='5m', limit=50)
-            sample_data = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'count', 'taker_buy_volume', 
-                'taker_buy_quote_volume', 'ignore'
-            ])
-            # Convert to numeric and keep only OHLC columns
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                sample_data[col] = pd.to_numeric(sample_data[col])
-            sample_data = sample_data[['open', 'high', 'low', 'close', 'volume']]
+            sample_data = klines_to_dataframe(klines)
             print(f"✅ Loaded {len(sample_data)} real market data points for volatility analysis")
         except Exception as e:
             # Fallback to sample data if klines fetch fails
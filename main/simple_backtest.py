@@ -17,6 +17,8 @@ import time
 # Simple backtest without complex imports
 import yaml
 
+from kline_frames import klines_to_dataframe
+
 def get_binance_data(symbol="BTCUSDT", interval="1m", days_back=60):
     """Fetch Bitcoin data from Binance API"""
     print(f"📊 Fetching {symbol} data from Binance API ({interval} interval, {days_back} days)...")
@@ -62,18 +64,7 @@ def get_binance_data(symbol="BTCUSDT", interval="1m", days_back=60):
                 break
         
         if all_data:
-            df = pd.DataFrame(all_data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'count', 'taker_buy_volume',
-                'taker_buy_quote_volume', 'ignore'
-            ])
-            
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col])
-            
-            df.set_index('timestamp', inplace=True)
-            df = df[['open', 'high', 'low', 'close', 'volume']]
+            df = klines_to_dataframe(all_data)
             
             print(f"✅ Data fetched: {len(df)} candles")
             print(f"📅 Period: {df.index[0]} to {df.index[-1]}")
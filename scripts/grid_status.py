@@ -37,27 +37,43 @@ def load_api_keys():
             continue
     return None, None
 
+# Binance client and USDT balance are fetched once per session
+_client = None
+_usdt_balance = None
+
+def get_client():
+    """Create (once) a Binance client from secrets.json and the strategy config"""
+    global _client
+    if _client is not None:
+        return _client
+    
+    from binance.client import Client
+    
+    api_key, api_secret = load_api_keys()
+    if not api_key:
+        print("⚠️  No API keys found")
+        return None
+    
+    config = load_config()
+    if not config:
+        return None
+    
+    is_testnet = config['api']['testnet']
+    
+    # Set timeout to prevent hanging
+    import socket
+    socket.setdefaulttimeout(10)
+    
+    _client = Client(api_key, api_secret, testnet=is_testnet)
+    return _client
+
 def get_current_price():
     """Get current BTC price"""
     try:
-        from binance.client import Client
-        
-        api_key, api_secret = load_api_keys()
-        if not api_key:
-            print("⚠️  No API keys found")
-            return None
-        
-        config = load_config()
-        if not config:
+        client = get_client()
+        if not client:
             return None
         
-        is_testnet = config['api']['testnet']
-        
-        # Set timeout to prevent hanging
-        import socket
-        socket.setdefaulttimeout(10)
-        
-        client = Client(api_key, api_secret, testnet=is_testnet)
         ticker = client.get_symbol_ticker(symbol='BTCUSDT')
         return float(ticker['price'])
         
@@ -65,6 +81,25 @@ def get_current_price():
         print(f"❌ Error fetching price: {e}")
         return None
 
+def get_usdt_balance():
+    """Get free USDT balance (cached for the session)"""
+    global _usdt_balance
+    if _usdt_balance is not None:
+        return _usdt_balance
+    
+    try:
+        client = get_client()
+        if not client:
+            return None
+        
+        balance = client.get_asset_balance(asset='USDT')
+        _usdt_balance = float(balance['free']) if balance else 0.0
+        return _usdt_balance
+        
+    except Exception as e:
+        print(f"❌ Error fetching USDT balance: {e}")
+        return None
+
 def calculate_grid_from_config(current_price, config):
     """Calculate grid levels using real configuration"""
     grid_cfg = config['grid']
@@ -74,10 +109,15 @@ def calculate_grid_from_config(current_price, config):
     spacing_pct = grid_cfg['grid_spacing_pct'] / 100  # Convert to decimal
     levels = grid_cfg['levels']
     capital_per_grid_pct = grid_cfg['capital_per_grid_pct'] / 100
+    total_capital_usage_pct = grid_cfg.get('total_capital_usage_pct', 100.0) / 100
     
-    # Cannot determine real capital without account balance - would need full trading system
-    print("⚠️  Cannot calculate real quantities without account balance")
-    return None
+    # Real capital from the account balance (same allocation as GridStrategyController)
+    usdt_balance = get_usdt_balance()
+    if usdt_balance is None:
+        print("⚠️  Cannot calculate real quantities without account balance")
+        return None
+    
+    capital_per_grid = usdt_balance * total_capital_usage_pct * capital_per_grid_pct
     
     grid_levels = []
     
@@ -126,6 +166,9 @@ def display_grid_status():
     
     # Generate grid using real config
     grid_levels = calculate_grid_from_config(current_price, config)
+    if not grid_levels:
+        print("❌ Could not calculate grid levels")
+        return
     
     print()
     print("🏗️  CURRENT GRID LEVELS (from your strategy_config.yaml)")
@@ -134,20 +177,25 @@ def display_grid_status():
     print("-" * 70)
     
     ready_count = 0
+    rows = []
     for level in grid_levels:
         price = level['price']
         
         # Determine status
         if level['side'] == 'BUY':
-            status = "🟢 READY" if current_price <= price else "⏳ WAIT"
-            if current_price <= price:
-                ready_count += 1
+            ready = current_price <= price
+            status = "🟢 READY" if ready else "⏳ WAIT"
         else:
-            status = "🔴 READY" if current_price >= price else "⏳ WAIT"
-            if current_price >= price:
-                ready_count += 1
+            ready = current_price >= price
+            status = "🔴 READY" if ready else "⏳ WAIT"
+        if ready:
+            ready_count += 1
         
-        print(f"{level['level']:>5} | {level['side']:<4} | ${price:>10,.2f} | {level['quantity']:>8.6f} | {status}")
+        rows.append(f"{level['level']:>5} | {level['side']:<4} | ${price:>10,.2f} | {level['quantity']:>8.6f} | {status}")
+    
+    # Emit the whole table with a single write
+    rows.append("")
+    sys.stdout.write("\n".join(rows))
     
     # Summary
     buy_levels = [l for l in grid_levels if l['side'] == 'BUY']
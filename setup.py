@@ -8,6 +8,16 @@ import json
 import subprocess
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SECRETS_PATH = "secrets.json"
+
+# Parsed secrets.json shared by create_secrets_template() and verify_setup()
+_secrets_cache = None
+
 def install_dependencies():
     """Install required Python packages."""
     print("📦 Installing dependencies...")
@@ -28,11 +38,45 @@ def install_dependencies():
     print("✅ All dependencies installed successfully!")
     return True
 
+def _read_secrets():
+    """
+    Read secrets.json once per run.
+    Returns (exists, secrets) where secrets is None if the file is missing or invalid.
+    """
+    global _secrets_cache
+    
+    if _secrets_cache is None:
+        try:
+            with open(SECRETS_PATH, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return False, None
+        
+        try:
+            secrets = orjson.loads(content) if orjson else json.loads(content)
+        except ValueError:
+            return True, None
+        
+        if not isinstance(secrets, dict):
+            return True, None
+        
+        _secrets_cache = secrets
+    
+    return True, _secrets_cache
+
+def _dump_json(data) -> bytes:
+    """Serialize data as indented JSON bytes (orjson when available)."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
 def create_secrets_template():
     """Create secrets.json template."""
-    secrets_path = "secrets.json"
+    global _secrets_cache
+    secrets_path = SECRETS_PATH
     
-    if os.path.exists(secrets_path):
+    exists, _ = _read_secrets()
+    if exists:
         print("📄 secrets.json already exists")
         return True
     
@@ -42,9 +86,10 @@ def create_secrets_template():
     }
     
     try:
-        with open(secrets_path, 'w') as f:
-            json.dump(template, f, indent=2)
+        with open(secrets_path, 'wb') as f:
+            f.write(_dump_json(template))
         
+        _secrets_cache = template
         print(f"📄 Created {secrets_path} template")
         print("🔑 Please add your Binance API keys!")
         print("💡 Since you're using a pseudo account, use the same keys for both testnet and live")
@@ -83,27 +128,34 @@ def verify_setup():
         "scripts/check_balance.py"
     ]
     
+    # One directory scan per parent dir instead of one stat() per file
+    dir_entries = {}
+    for file_path in key_files:
+        directory = os.path.dirname(file_path) or "."
+        if directory not in dir_entries:
+            try:
+                with os.scandir(directory) as entries:
+                    dir_entries[directory] = {e.name for e in entries if e.is_file()}
+            except OSError:
+                dir_entries[directory] = set()
+
     for file_path in key_files:
-        if os.path.exists(file_path):
+        directory = os.path.dirname(file_path) or "."
+        if os.path.basename(file_path) in dir_entries[directory]:
             checks.append(f"✅ {file_path}")
         else:
             checks.append(f"❌ Missing: {file_path}")
     
-    # Check secrets.json
-    if os.path.exists("secrets.json"):
-        try:
-            with open("secrets.json", 'r') as f:
-                secrets = json.load(f)
-            
-            if secrets.get("api_key", "").startswith("your_"):
-                checks.append("⚠️  secrets.json needs your API keys")
-            else:
-                checks.append("✅ secrets.json configured")
-                
-        except:
-            checks.append("❌ secrets.json invalid")
-    else:
+    # Check secrets.json (reuses the parse from create_secrets_template)
+    exists, secrets = _read_secrets()
+    if not exists:
         checks.append("❌ secrets.json missing")
+    elif secrets is None or not isinstance(secrets.get("api_key", ""), str):
+        checks.append("❌ secrets.json invalid")
+    elif secrets.get("api_key", "").startswith("your_"):
+        checks.append("⚠️  secrets.json needs your API keys")
+    else:
+        checks.append("✅ secrets.json configured")
     
     for check in checks:
         print(check)
@@ -1,9 +1,46 @@
 import json
+import os
 import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 
+@dataclass(slots=True)
+class Fill:
+    """A single filled grid order within a cycle."""
+    order_id: str
+    timestamp: datetime
+    side: str
+    price: float
+    quantity: float
+    fee: float
+    fee_asset: str
+    value: float
+
+
+@dataclass(slots=True)
+class Cycle:
+    """A buy/sell trading cycle and its profit figures."""
+    id: str
+    start_time: datetime
+    start_price: float
+    grid_levels: int
+    buy_orders: List[Dict]
+    sell_orders: List[Dict]
+    orders_placed: int = 0
+    orders_filled: int = 0
+    gross_profit: float = 0.0
+    fees_paid: float = 0.0
+    net_profit: float = 0.0
+    profit_pct: float = 0.0
+    status: str = 'active'
+    fills: List[Fill] = field(default_factory=list)
+    end_time: Optional[datetime] = None
+    duration: Optional[timedelta] = None
+
+
 class CycleTracker:
     """
     Tracks grid trading cycles and profitability metrics.
@@ -13,7 +50,6 @@ class CycleTracker:
     def __init__(self, event_logger, config_manager):
         self.logger = event_logger
         self.cfg = config_manager
-        self.cycles = []
         self.current_cycle = None
         self.daily_stats = {}
         self.total_profit = 0.0
@@ -23,6 +59,8 @@ class CycleTracker:
         self.winning_cycles = 0
         self.max_drawdown = 0.0
         self.current_drawdown = 0.0
+        self._consec_losses = 0
+        self._max_consec_losses = 0
         
         # Load performance targets from config (YAML compliance)
         perf_cfg = self.cfg.get_performance_config() if hasattr(self.cfg, 'get_performance_config') else {}
@@ -32,6 +70,21 @@ class CycleTracker:
         self.track_cycles = perf_cfg.get('track_cycles', True)
         self.log_performance = perf_cfg.get('log_performance', True)
         
+        # Keep a rolling window of completed cycles; older ones are appended to disk
+        self.history_window = perf_cfg.get('history_window', 10_000)
+        self.cycles = deque(maxlen=self.history_window)
+        
+        # Lifetime figures, so summaries don't depend on how many cycles are still in the window
+        self.total_cycles_completed = 0
+        self.successful_cycles = 0
+        self._profit_pct_sum = 0.0
+        self._largest_loss = 0.0
+        
+        # Archive is opened on the first eviction and kept open (line-buffered: one write per cycle)
+        self._archive_fh = None
+        log_cfg = self.cfg.get_logging_config() if hasattr(self.cfg, 'get_logging_config') else {}
+        self.cycle_archive_file = os.path.join(log_cfg.get('log_directory', 'logs'), 'cycle_history.jsonl')
+        
     def start_new_cycle(self, initial_price: float, grid_levels: List[Dict]):
         """
         Start tracking a new trading cycle.
@@ -41,28 +94,20 @@ class CycleTracker:
             
         cycle_id = f"cycle_{int(time.time())}"
         
-        self.current_cycle = {
-            'id': cycle_id,
-            'start_time': datetime.now(),
-            'start_price': initial_price,
-            'grid_levels': len(grid_levels),
-            'orders_placed': 0,
-            'orders_filled': 0,
-            'buy_orders': [level for level in grid_levels if level['side'] == 'BUY'],
-            'sell_orders': [level for level in grid_levels if level['side'] == 'SELL'],
-            'gross_profit': 0.0,
-            'fees_paid': 0.0,
-            'net_profit': 0.0,
-            'profit_pct': 0.0,
-            'status': 'active',
-            'fills': []
-        }
+        self.current_cycle = Cycle(
+            id=cycle_id,
+            start_time=datetime.now(),
+            start_price=initial_price,
+            grid_levels=len(grid_levels),
+            buy_orders=[level for level in grid_levels if level['side'] == 'BUY'],
+            sell_orders=[level for level in grid_levels if level['side'] == 'SELL']
+        )
         
         self.logger.log_signal("cycle_started", {
             "cycle_id": cycle_id,
             "start_price": initial_price,
             "grid_levels": len(grid_levels),
-            "timestamp": self.current_cycle['start_time'].isoformat()
+            "timestamp": self.current_cycle.start_time.isoformat()
         })
         
         return cycle_id
@@ -75,20 +120,20 @@ class CycleTracker:
         if not self.current_cycle:
             return
             
-        fill_data = {
-            'order_id': order_id,
-            'timestamp': datetime.now(),
-            'side': side,
-            'price': price,
-            'quantity': quantity,
-            'fee': fee,
-            'fee_asset': fee_asset,
-            'value': price * quantity
-        }
-        
-        self.current_cycle['fills'].append(fill_data)
-        self.current_cycle['orders_filled'] += 1
-        self.current_cycle['fees_paid'] += fee
+        fill_data = Fill(
+            order_id=order_id,
+            timestamp=datetime.now(),
+            side=side,
+            price=price,
+            quantity=quantity,
+            fee=fee,
+            fee_asset=fee_asset,
+            value=price * quantity
+        )
+        
+        self.current_cycle.fills.append(fill_data)
+        self.current_cycle.orders_filled += 1
+        self.current_cycle.fees_paid += fee
         
         # Track fees from trades
         if fee_asset == 'USDT':
@@ -98,7 +143,7 @@ class CycleTracker:
             self.total_fees_paid += fee_amount
         
         self.logger.log_signal("order_filled", {
-            "cycle_id": self.current_cycle['id'],
+            "cycle_id": self.current_cycle.id,
             "order_id": order_id,
             "side": side,
             "price": price,
@@ -117,9 +162,9 @@ class CycleTracker:
         if not self.current_cycle:
             return
             
-        fills = self.current_cycle['fills']
-        buy_fills = [f for f in fills if f['side'] == 'BUY']
-        sell_fills = [f for f in fills if f['side'] == 'SELL']
+        fills = self.current_cycle.fills
+        buy_fills = [f for f in fills if f.side == 'BUY']
+        sell_fills = [f for f in fills if f.side == 'SELL']
         
         # Simple completion check: at least one buy and one sell
         if len(buy_fills) > 0 and len(sell_fills) > 0:
@@ -133,67 +178,98 @@ class CycleTracker:
             return
             
         cycle = self.current_cycle
-        cycle['end_time'] = datetime.now()
-        cycle['duration'] = cycle['end_time'] - cycle['start_time']
-        cycle['status'] = 'completed'
+        cycle.end_time = datetime.now()
+        cycle.duration = cycle.end_time - cycle.start_time
+        cycle.status = 'completed'
         
         # Calculate profits
-        buy_fills = [f for f in cycle['fills'] if f['side'] == 'BUY']
-        sell_fills = [f for f in cycle['fills'] if f['side'] == 'SELL']
+        buy_fills = [f for f in cycle.fills if f.side == 'BUY']
+        sell_fills = [f for f in cycle.fills if f.side == 'SELL']
         
-        total_buy_value = sum(f['value'] for f in buy_fills)
-        total_sell_value = sum(f['value'] for f in sell_fills)
+        total_buy_value = sum(f.value for f in buy_fills)
+        total_sell_value = sum(f.value for f in sell_fills)
         
-        cycle['gross_profit'] = total_sell_value - total_buy_value
-        cycle['net_profit'] = cycle['gross_profit'] - cycle['fees_paid']
+        cycle.gross_profit = total_sell_value - total_buy_value
+        cycle.net_profit = cycle.gross_profit - cycle.fees_paid
         
         # Calculate profit percentage based on capital used
         if total_buy_value > 0:
-            cycle['profit_pct'] = (cycle['net_profit'] / total_buy_value) * 100
+            cycle.profit_pct = (cycle.net_profit / total_buy_value) * 100
         
         # Update totals and track wins/losses
-        if cycle['net_profit'] > 0:
-            self.total_profit += cycle['net_profit']
+        if cycle.net_profit > 0:
+            self.total_profit += cycle.net_profit
             self.winning_cycles += 1
             # Reset drawdown on profit
             self.current_drawdown = 0.0
         else:
-            self.total_loss += abs(cycle['net_profit'])
+            self.total_loss += abs(cycle.net_profit)
             self.losing_cycles += 1
             # Update drawdown tracking
-            self.current_drawdown += abs(cycle['net_profit'])
+            self.current_drawdown += abs(cycle.net_profit)
             if self.current_drawdown > self.max_drawdown:
                 self.max_drawdown = self.current_drawdown
         
-        self.total_fees_paid += cycle['fees_paid']
+        self.total_fees_paid += cycle.fees_paid
+        
+        # Consecutive-loss streaks are tracked incrementally for risk checks
+        if cycle.net_profit < 0:
+            self._consec_losses += 1
+            if self._consec_losses > self._max_consec_losses:
+                self._max_consec_losses = self._consec_losses
+        else:
+            self._consec_losses = 0
+        if -cycle.net_profit > self._largest_loss:
+            self._largest_loss = -cycle.net_profit
         
-        # Add to cycles history
+        if cycle.profit_pct >= (self.target_profit_per_cycle * 100):
+            self.successful_cycles += 1
+        self._profit_pct_sum += cycle.profit_pct
+        
+        # Add to cycles history (archive the oldest cycle before the window evicts it)
+        if len(self.cycles) == self.cycles.maxlen:
+            self._flush_old_to_disk(self.cycles[0])
         self.cycles.append(cycle)
+        self.total_cycles_completed += 1
         
         # Update daily stats
         self._update_daily_stats(cycle)
         
         self.logger.log_signal("cycle_completed", {
-            "cycle_id": cycle['id'],
-            "duration_minutes": cycle['duration'].total_seconds() / 60,
-            "gross_profit": cycle['gross_profit'],
-            "net_profit": cycle['net_profit'],
-            "profit_pct": cycle['profit_pct'],
-            "fees_paid": cycle['fees_paid'],
-            "target_met": cycle['profit_pct'] >= (self.target_profit_per_cycle * 100)
+            "cycle_id": cycle.id,
+            "duration_minutes": cycle.duration.total_seconds() / 60,
+            "gross_profit": cycle.gross_profit,
+            "net_profit": cycle.net_profit,
+            "profit_pct": cycle.profit_pct,
+            "fees_paid": cycle.fees_paid,
+            "target_met": cycle.profit_pct >= (self.target_profit_per_cycle * 100)
         })
         
         # Reset current cycle
         self.current_cycle = None
     
+    def _flush_old_to_disk(self, cycle):
+        """Append a cycle leaving the in-memory window to the JSONL archive."""
+        try:
+            if self._archive_fh is None:
+                os.makedirs(os.path.dirname(self.cycle_archive_file) or '.', exist_ok=True)
+                self._archive_fh = open(self.cycle_archive_file, 'a', buffering=1)
+            self._archive_fh.write(json.dumps(asdict(cycle), default=str) + "\n")
+        except OSError as e:
+            self.logger.log_error("Failed to archive cycle", {
+                "cycle_id": cycle.id,
+                "error": str(e)
+            })
+    
     def _update_daily_stats(self, completed_cycle):
         """
         Update daily performance statistics.
         """
-        today = completed_cycle['end_time'].date()
+        today = completed_cycle.end_time.date()
         
         if today not in self.daily_stats:
             self.daily_stats[today] = {
+                'date': today.isoformat(),  # formatted once per day for logging
                 'cycles_completed': 0,
                 'gross_profit': 0.0,
                 'net_profit': 0.0,
@@ -205,20 +281,20 @@ class CycleTracker:
         
         daily = self.daily_stats[today]
         daily['cycles_completed'] += 1
-        daily['gross_profit'] += completed_cycle['gross_profit']
-        daily['net_profit'] += completed_cycle['net_profit']
-        daily['fees_paid'] += completed_cycle['fees_paid']
+        daily['gross_profit'] += completed_cycle.gross_profit
+        daily['net_profit'] += completed_cycle.net_profit
+        daily['fees_paid'] += completed_cycle.fees_paid
         daily['avg_profit_per_cycle'] = daily['net_profit'] / daily['cycles_completed']
         
         # Check if cycle met target
-        if completed_cycle['profit_pct'] >= (self.target_profit_per_cycle * 100):
+        if completed_cycle.profit_pct >= (self.target_profit_per_cycle * 100):
             daily['target_cycles_met'] += 1
         
         # Check if daily target is met
         daily['daily_target_met'] = (daily['net_profit'] / self.total_capital) >= self.daily_target_profit
         
         self.logger.log_signal("daily_stats_updated", {
-            "date": today.isoformat(),
+            "date": daily['date'],
             "cycles_completed": daily['cycles_completed'],
             "net_profit": daily['net_profit'],
             "target_cycles_met": daily['target_cycles_met'],
@@ -229,13 +305,13 @@ class CycleTracker:
         """
         Get comprehensive performance summary.
         """
-        total_cycles = len(self.cycles)
-        successful_cycles = len([c for c in self.cycles if c['profit_pct'] >= (self.target_profit_per_cycle * 100)])
-        
-        avg_profit_per_cycle = sum(c['net_profit'] for c in self.cycles) / total_cycles if total_cycles > 0 else 0
-        avg_profit_pct = sum(c['profit_pct'] for c in self.cycles) / total_cycles if total_cycles > 0 else 0
+        # Every figure covers all completed cycles, including those archived out of the window
+        total_cycles = self.total_cycles_completed
+        successful_cycles = self.successful_cycles
         
         net_pnl = self.total_profit - self.total_loss
+        avg_profit_per_cycle = net_pnl / total_cycles if total_cycles > 0 else 0
+        avg_profit_pct = self._profit_pct_sum / total_cycles if total_cycles > 0 else 0
         win_rate = (self.winning_cycles / total_cycles * 100) if total_cycles > 0 else 0
         
         return {
@@ -265,29 +341,12 @@ class CycleTracker:
         }
     
     def _calculate_max_consecutive_losses(self) -> int:
-        """Calculate maximum consecutive losing cycles."""
-        if not self.cycles:
-            return 0
-            
-        max_consecutive = 0
-        current_consecutive = 0
-        
-        for cycle in self.cycles:
-            if cycle['net_profit'] < 0:
-                current_consecutive += 1
-                max_consecutive = max(max_consecutive, current_consecutive)
-            else:
-                current_consecutive = 0
-                
-        return max_consecutive
+        """Maximum consecutive losing cycles (maintained in _complete_cycle)."""
+        return self._max_consec_losses
     
     def _get_largest_single_loss(self) -> float:
-        """Get the largest single cycle loss."""
-        if not self.cycles:
-            return 0.0
-            
-        losses = [cycle['net_profit'] for cycle in self.cycles if cycle['net_profit'] < 0]
-        return abs(min(losses)) if losses else 0.0
+        """Get the largest single cycle loss (maintained in _complete_cycle)."""
+        return self._largest_loss
     
     def check_risk_alerts(self) -> List[Dict]:
         """Check for risk alert conditions."""
@@ -309,7 +368,7 @@ class CycleTracker:
                 })
         
         # Consecutive losses alert
-        consecutive_losses = self._calculate_max_consecutive_losses()
+        consecutive_losses = self._max_consec_losses
         if consecutive_losses >= 5:
             alerts.append({
                 'type': 'CONSECUTIVE_LOSSES',
@@ -320,8 +379,8 @@ class CycleTracker:
             })
         
         # Win rate alert
-        if len(self.cycles) >= 10:
-            win_rate = (self.winning_cycles / len(self.cycles)) * 100
+        if self.total_cycles_completed >= 10:
+            win_rate = (self.winning_cycles / self.total_cycles_completed) * 100
             if win_rate < 60:  # Grid strategies should have high win rate
                 alerts.append({
                     'type': 'LOW_WIN_RATE',
@@ -349,11 +408,10 @@ class CycleTracker:
         cycles_progress = (daily_stats['cycles_completed'] / self.daily_target_cycles) * 100
         target_cycles_rate = (daily_stats['target_cycles_met'] / max(daily_stats['cycles_completed'], 1)) * 100
         
-        # Overall performance metrics
-        total_cycles = len(self.cycles)
-        total_net_profit = sum(cycle['net_profit'] for cycle in self.cycles)
-        successful_cycles = len([c for c in self.cycles if c['profit_pct'] >= (self.target_profit_per_cycle * 100)])
-        success_rate = (successful_cycles / max(total_cycles, 1)) * 100
+        # Overall performance metrics (lifetime, like get_performance_summary)
+        total_cycles = self.total_cycles_completed
+        total_net_profit = self.total_profit - self.total_loss
+        success_rate = (self.successful_cycles / max(total_cycles, 1)) * 100
         
         return {
             "performance_logging": "enabled",
@@ -392,10 +450,10 @@ class CycleTracker:
             'performance_summary': self.get_performance_summary(),
             'cycles_history': [
                 {
-                    **cycle,
-                    'start_time': cycle['start_time'].isoformat(),
-                    'end_time': cycle['end_time'].isoformat() if cycle.get('end_time') else None,
-                    'duration': str(cycle['duration']) if cycle.get('duration') else None
+                    **asdict(cycle),
+                    'start_time': cycle.start_time.isoformat(),
+                    'end_time': cycle.end_time.isoformat() if cycle.end_time else None,
+                    'duration': str(cycle.duration) if cycle.duration else None
                 }
                 for cycle in self.cycles
             ]
@@ -2,13 +2,38 @@
 Fee calculation and optimization based on YAML configuration.
 Handles maker/taker fees, discounts, and optimization strategies.
 """
+import numpy as np
 from typing import Dict, Tuple, Optional
 from datetime import datetime
 
 
+def _grid_fee_totals(prices: np.ndarray, is_buy: np.ndarray, base_quantity: float, fee_rate: float) -> Dict:
+    """Fee totals for grid orders given their prices and buy/sell partition."""
+    # Every grid order is a LIMIT (maker) order
+    fees = prices * (base_quantity * fee_rate)
+    
+    count = len(fees)
+    total_buy_fees = float(fees[is_buy].sum())
+    total_sell_fees = float(fees[~is_buy].sum())
+    buy_orders_count = int(is_buy.sum())
+    total_fees = total_buy_fees + total_sell_fees
+    
+    return {
+        'total_fees': total_fees,
+        'total_buy_fees': total_buy_fees,
+        'total_sell_fees': total_sell_fees,
+        'buy_orders_count': buy_orders_count,
+        'sell_orders_count': count - buy_orders_count,
+        'avg_fee_per_order': total_fees / count if count else 0,
+        'fees_as_pct_of_capital': 0  # Will be calculated by caller
+    }
+
+
 class FeeCalculator:
     """Handles fee calculations and optimization from YAML configuration."""
     
+    MAKER_ORDER_TYPES = frozenset({'LIMIT', 'LIMIT_MAKER'})
+    
     def __init__(self, config_manager, event_logger):
         self.cfg = config_manager
         self.logger = event_logger
@@ -22,41 +47,44 @@ class FeeCalculator:
         self.min_fee_balance = fees_cfg.get('min_fee_balance', 0.0)
         self.include_fees_in_calculation = fees_cfg.get('include_fees_in_calculation', True)
         
+        # Fee rates after discount, fixed for the lifetime of the calculator
+        self._discount_factor = (1 - self.fee_discount_pct) if self.use_fee_discount else 1.0
+        self._effective_maker_rate = self.maker_fee_pct * self._discount_factor
+        self._effective_taker_rate = self.taker_fee_pct * self._discount_factor
+        
         # Fee tracking
         self.total_fees_paid = 0.0
         self.total_fee_savings = 0.0
         self.fee_payments_count = 0
         
-        self.logger.log_signal("fee_calculator_initialized", {
-            "maker_fee_pct": self.maker_fee_pct * 100,
-            "taker_fee_pct": self.taker_fee_pct * 100,
-            "use_fee_discount": self.use_fee_discount,
-            "fee_discount_pct": self.fee_discount_pct * 100,
-            "include_fees_in_calculation": self.include_fees_in_calculation
-        })
+        # Active grid layout, set via set_grid()
+        self._grid_prices = np.empty(0, dtype=np.float64)
+        self._grid_is_buy = np.empty(0, dtype=bool)
+        
+        # Skip building signal payloads when the logger drops them
+        self._log_enabled = self.logger.enabled_for('signal')
+        
+        if self._log_enabled:
+            self.logger.log_signal("fee_calculator_initialized", {
+                "maker_fee_pct": self.maker_fee_pct * 100,
+                "taker_fee_pct": self.taker_fee_pct * 100,
+                "use_fee_discount": self.use_fee_discount,
+                "fee_discount_pct": self.fee_discount_pct * 100,
+                "include_fees_in_calculation": self.include_fees_in_calculation
+            })
     
     def calculate_order_fee(self, order_value: float, order_type: str = 'LIMIT', 
                            fee_asset: str = 'USDT') -> Dict[str, float]:
         """Calculate fee for a trading order based on YAML configuration."""
-        # Determine base fee rate
-        if order_type in ['LIMIT', 'LIMIT_MAKER']:
-            base_fee_rate = self.maker_fee_pct
-            fee_type = 'MAKER'
+        # Determine base and discounted fee rate
+        if order_type in self.MAKER_ORDER_TYPES:
+            base_fee_rate, effective_rate, fee_type = self.maker_fee_pct, self._effective_maker_rate, 'MAKER'
         else:  # MARKET, STOP_LOSS, etc.
-            base_fee_rate = self.taker_fee_pct
-            fee_type = 'TAKER'
+            base_fee_rate, effective_rate, fee_type = self.taker_fee_pct, self._effective_taker_rate, 'TAKER'
         
-        # Calculate base fee
         base_fee = order_value * base_fee_rate
-        
-        # Apply discount if enabled
-        if self.use_fee_discount:
-            discount_amount = base_fee * self.fee_discount_pct
-            final_fee = base_fee - discount_amount
-            fee_savings = discount_amount
-        else:
-            final_fee = base_fee
-            fee_savings = 0.0
+        final_fee = order_value * effective_rate
+        fee_savings = base_fee - final_fee
         
         return {
             'base_fee': base_fee,
@@ -69,36 +97,35 @@ class FeeCalculator:
             'discount_applied': self.use_fee_discount
         }
     
-    def calculate_grid_order_fees(self, grid_levels: list, current_price: float, 
+    def calculate_final_fee(self, order_value: float, order_type: str = 'LIMIT') -> float:
+        """Final (post-discount) fee only, for per-fill paths that don't need the full breakdown."""
+        if order_type in self.MAKER_ORDER_TYPES:
+            return order_value * self._effective_maker_rate
+        return order_value * self._effective_taker_rate
+    
+    def set_grid(self, grid_levels: list):
+        """Store the active grid's prices and buy/sell partition for calculate_grid_order_fees()."""
+        self._grid_prices, self._grid_is_buy = self._grid_arrays(grid_levels)
+    
+    @staticmethod
+    def _grid_arrays(grid_levels: list):
+        """(prices, is_buy) arrays for a list of level dicts."""
+        count = len(grid_levels)
+        prices = np.fromiter((level['price'] for level in grid_levels), dtype=np.float64, count=count)
+        is_buy = np.fromiter((level['side'] == 'BUY' for level in grid_levels), dtype=bool, count=count)
+        return prices, is_buy
+    
+    def calculate_grid_order_fees(self, grid_levels: Optional[list], current_price: Optional[float], 
                                  base_quantity: float) -> Dict:
-        """Calculate total fees for all potential grid orders."""
-        total_buy_fees = 0.0
-        total_sell_fees = 0.0
-        buy_orders_count = 0
-        sell_orders_count = 0
-        
-        for level in grid_levels:
-            order_value = level['price'] * base_quantity
-            fee_info = self.calculate_order_fee(order_value, 'LIMIT')
-            
-            if level['side'] == 'BUY':
-                total_buy_fees += fee_info['final_fee']
-                buy_orders_count += 1
-            else:  # SELL
-                total_sell_fees += fee_info['final_fee']
-                sell_orders_count += 1
-        
-        total_fees = total_buy_fees + total_sell_fees
-        
-        return {
-            'total_fees': total_fees,
-            'total_buy_fees': total_buy_fees,
-            'total_sell_fees': total_sell_fees,
-            'buy_orders_count': buy_orders_count,
-            'sell_orders_count': sell_orders_count,
-            'avg_fee_per_order': total_fees / len(grid_levels) if grid_levels else 0,
-            'fees_as_pct_of_capital': 0  # Will be calculated by caller
-        }
+        """
+        Calculate total fees for all potential grid orders.
+        Pass grid_levels=None to use the grid stored by set_grid().
+        """
+        if grid_levels is None:
+            prices, is_buy = self._grid_prices, self._grid_is_buy
+        else:
+            prices, is_buy = self._grid_arrays(grid_levels)
+        return _grid_fee_totals(prices, is_buy, base_quantity, self._effective_maker_rate)
     
     def record_fee_payment(self, fee_amount: float, fee_asset: str = 'USDT', 
                           order_type: str = 'LIMIT'):
@@ -113,14 +140,15 @@ class FeeCalculator:
             savings = original_fee - fee_amount
             self.total_fee_savings += savings
         
-        self.logger.log_signal("fee_payment_recorded", {
-            "fee_amount": fee_amount,
-            "fee_asset": fee_asset,
-            "order_type": order_type,
-            "total_fees_paid": self.total_fees_paid,
-            "total_fee_savings": self.total_fee_savings,
-            "payments_count": self.fee_payments_count
-        })
+        if self._log_enabled:
+            self.logger.log_signal("fee_payment_recorded", {
+                "fee_amount": fee_amount,
+                "fee_asset": fee_asset,
+                "order_type": order_type,
+                "total_fees_paid": self.total_fees_paid,
+                "total_fee_savings": self.total_fee_savings,
+                "payments_count": self.fee_payments_count
+            })
     
     def calculate_net_profit_with_fees(self, gross_profit: float, 
                                       trade_fees: float) -> Dict[str, float]:
@@ -220,7 +248,7 @@ class FeeCalculator:
             'optimization': {
                 'maker_vs_taker_difference': (self.taker_fee_pct - self.maker_fee_pct) * 100,
                 'discount_active': self.use_fee_discount,
-                'effective_maker_rate': (self.maker_fee_pct * (1 - self.fee_discount_pct)) * 100 if self.use_fee_discount else self.maker_fee_pct * 100
+                'effective_maker_rate': self._effective_maker_rate * 100
             }
         }
     
@@ -234,12 +262,9 @@ class FeeCalculator:
         base_taker_fees = taker_volume * self.taker_fee_pct
         base_total_fees = base_maker_fees + base_taker_fees
         
-        if self.use_fee_discount:
-            discount_amount = base_total_fees * self.fee_discount_pct
-            final_total_fees = base_total_fees - discount_amount
-        else:
-            discount_amount = 0.0
-            final_total_fees = base_total_fees
+        # Discount factor is 1.0 when no discount is configured
+        final_total_fees = base_total_fees * self._discount_factor
+        discount_amount = base_total_fees - final_total_fees
         
         return {
             'daily_trading_volume': daily_trading_volume,
@@ -2,7 +2,7 @@
 Technical indicators for grid trading strategy.
 RSI, MACD, and other indicators based on YAML configuration.
 """
-import numpy as np
+import math
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
@@ -10,6 +10,9 @@ from datetime import datetime
 class TechnicalIndicators:
     """Handles technical indicator calculations from YAML configuration."""
     
+    # Below this many points, plain Python sums beat numpy/pandas call overhead
+    SMALL_WINDOW = 32
+    
     def __init__(self, config_manager, event_logger):
         self.cfg = config_manager
         self.logger = event_logger
@@ -28,17 +31,52 @@ class TechnicalIndicators:
         
         # Bollinger Bands
         self.bb_period = advanced_cfg.get('bollinger_period', 20)
-        self.bb_std_dev = advanced_cfg.get('bollinger_std_dev', 2)
+        self.bb_std_dev = float(advanced_cfg.get('bollinger_std_dev', 2))
         
         # Moving averages
         self.sma_short_period = advanced_cfg.get('sma_short_period', 10)
         self.sma_long_period = advanced_cfg.get('sma_long_period', 50)
         
-        # Price history cache for calculations
-        self.price_history = []
+        # Price history ring buffer (indicators only need prices, so no timestamps are kept)
         self.max_history_length = 200  # Keep last 200 price points
+        self._head = 0   # Next write slot
+        self._count = 0  # Number of valid points in the buffer
+        self._ticks = 0  # Total prices added; invalidates cached signals
+        
+        # Last computed signals / status summary, reused until a new price arrives
+        self._signal_cache = (None, None, None)  # (ticks, price, signals)
+        self._summary_cache = (None, None)       # (ticks, summary)
+        self._indicator_cache = (None, None)     # (ticks, indicator snapshot)
+        
+        # Running gain/loss sums over the last rsi_period deltas
+        self._rsi_gain_sum = 0.0
+        self._rsi_loss_sum = 0.0
+        
+        # Streaming MACD state: fast/slow EMAs of price and the signal EMA of the MACD line
+        self._macd_fast_alpha = 2.0 / (self.macd_fast_period + 1)
+        self._macd_slow_alpha = 2.0 / (self.macd_slow_period + 1)
+        self._macd_signal_alpha = 2.0 / (self.macd_signal_period + 1)
+        self._ema_fast = 0.0
+        self._ema_slow = 0.0
+        self._macd_signal = 0.0
+        
+        # Running [sum, sum of squares] of (price - _shift) per SMA / Bollinger window length.
+        # Shifting by a recent price keeps sum_sq/N - mean^2 from cancelling at BTC-level prices,
+        # and every max_history_length ticks all running sums are rebuilt from the buffer
+        self._shift = 0.0
+        self._window_sums = {
+            period: [0.0, 0.0]
+            for period in (self.sma_short_period, self.sma_long_period, self.bb_period)
+        }
         
+        # NumPy is only imported when indicators are enabled
+        self._np = None
         if self.use_technical_indicators:
+            import numpy as np
+            self._np = np
+            self._prices = np.empty(self.max_history_length, dtype=np.float64)
+            
+        if self.use_technical_indicators and self.logger.enabled_for('signal'):
             self.logger.log_signal("technical_indicators_enabled", {
                 "rsi_oversold": self.rsi_oversold,
                 "rsi_overbought": self.rsi_overbought,
@@ -55,16 +93,93 @@ class TechnicalIndicators:
         if not self.use_technical_indicators:
             return
             
-        price_point = {
-            'price': price,
-            'timestamp': timestamp or datetime.now()
-        }
+        self._update_rsi_sums(price)
+        self._update_window_sums(price)
+        self._update_macd_state(price)
+        
+        # Overwrite the oldest slot once the buffer is full
+        self._prices[self._head] = price
+        self._head = (self._head + 1) % self.max_history_length
+        if self._count < self.max_history_length:
+            self._count += 1
+        self._ticks += 1
+        
+        # Drop the rounding error the add/subtract updates accumulate
+        if self._ticks % self.max_history_length == 0:
+            self._resync_sums()
+    
+    def _resync_sums(self):
+        """Recompute the RSI and window sums exactly from the buffer, re-centred on the latest price."""
+        np = self._np
+        self._shift = float(self._prices[self._head - 1])
+        
+        deltas = np.diff(self._recent(min(self._count, self.rsi_period + 1)))
+        self._rsi_gain_sum = float(deltas[deltas > 0].sum())
+        self._rsi_loss_sum = float(-deltas[deltas < 0].sum())
+        
+        for period, sums in self._window_sums.items():
+            window = self._recent(min(self._count, period)) - self._shift
+            sums[0] = float(window.sum())
+            sums[1] = float(np.dot(window, window))
+    
+    def _update_rsi_sums(self, price: float):
+        """Add the newest delta to the RSI window and drop the one falling out of it."""
+        if self._count == 0:
+            return
         
-        self.price_history.append(price_point)
+        size = self.max_history_length
+        delta = price - float(self._prices[self._head - 1])
+        if delta > 0:
+            self._rsi_gain_sum += delta
+        else:
+            self._rsi_loss_sum -= delta
+        
+        period = self.rsi_period
+        if self._count >= period + 1:
+            old_delta = (float(self._prices[(self._head - period) % size])
+                         - float(self._prices[(self._head - period - 1) % size]))
+            if old_delta > 0:
+                self._rsi_gain_sum -= old_delta
+            else:
+                self._rsi_loss_sum += old_delta
+    
+    def _update_window_sums(self, price: float):
+        """Slide each SMA / Bollinger window forward by one price."""
+        if self._count == 0:
+            self._shift = price
+        
+        size = self.max_history_length
+        shift = self._shift
+        x = price - shift
+        for period, sums in self._window_sums.items():
+            sums[0] += x
+            sums[1] += x * x
+            if self._count >= period:
+                old = float(self._prices[(self._head - period) % size]) - shift
+                sums[0] -= old
+                sums[1] -= old * old
+    
+    def _update_macd_state(self, price: float):
+        """Advance the MACD EMAs by one price (seeded with the first price, like ewm(adjust=False))."""
+        if self._count == 0:
+            self._ema_fast = self._ema_slow = price
+            self._macd_signal = 0.0
+            return
         
-        # Keep only recent history
-        if len(self.price_history) > self.max_history_length:
-            self.price_history = self.price_history[-self.max_history_length:]
+        self._ema_fast += self._macd_fast_alpha * (price - self._ema_fast)
+        self._ema_slow += self._macd_slow_alpha * (price - self._ema_slow)
+        self._macd_signal += self._macd_signal_alpha * ((self._ema_fast - self._ema_slow) - self._macd_signal)
+    
+    def _recent(self, n: int):
+        """Return the last n prices in chronological order (a view unless the window wraps)."""
+        start = self._head - n
+        if start >= 0:
+            return self._prices[start:self._head]
+        return self._np.concatenate((self._prices[start:], self._prices[:self._head]))
+    
+    def _recent_list(self, n: int) -> List[float]:
+        """Return the last n prices as plain Python floats."""
+        return self._recent(n).tolist()
     
     def calculate_rsi(self, period: int = None) -> Optional[float]:
         """Calculate RSI (Relative Strength Index)."""
@@ -72,17 +187,27 @@ class TechnicalIndicators:
             return None
             
         period = period or self.rsi_period
-        if len(self.price_history) < period + 1:
+        if self._count < period + 1:
             return None
             
-        prices = [point['price'] for point in self.price_history[-(period + 1):]]
-        deltas = np.diff(prices)
-        
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains)
-        avg_loss = np.mean(losses)
+        if period == self.rsi_period:
+            avg_gain = self._rsi_gain_sum / period
+            avg_loss = self._rsi_loss_sum / period
+        elif period < self.SMALL_WINDOW:
+            window = self._recent_list(period + 1)
+            total_gain = total_loss = 0.0
+            for prev, price in zip(window, window[1:]):
+                delta = price - prev
+                if delta > 0:
+                    total_gain += delta
+                else:
+                    total_loss -= delta
+            avg_gain = total_gain / period
+            avg_loss = total_loss / period
+        else:
+            deltas = self._np.diff(self._recent(period + 1))
+            avg_gain = self._np.maximum(deltas, 0.0).mean()
+            avg_loss = self._np.maximum(-deltas, 0.0).mean()
         
         if avg_loss == 0:
             return 100.0
@@ -97,25 +222,15 @@ class TechnicalIndicators:
         if not self.use_technical_indicators:
             return None
             
-        if len(self.price_history) < self.macd_slow_period:
+        if self._count < self.macd_slow_period:
             return None
             
-        prices = np.array([point['price'] for point in self.price_history])
-        
-        # Calculate EMAs
-        ema_fast = self._calculate_ema(prices, self.macd_fast_period)
-        ema_slow = self._calculate_ema(prices, self.macd_slow_period)
+        # EMAs are updated per price in add_price_data
+        macd_line = self._ema_fast - self._ema_slow
+        signal_line = self._macd_signal
         
-        if ema_fast is None or ema_slow is None:
-            return None
-            
-        macd_line = ema_fast - ema_slow
-        
-        # Calculate signal line (EMA of MACD line)
-        # For simplicity, using SMA instead of EMA for signal
-        if len(self.price_history) >= self.macd_slow_period + self.macd_signal_period:
-            recent_macd_values = [macd_line] * self.macd_signal_period  # Simplified
-            signal_line = np.mean(recent_macd_values)
+        # Signal line (EMA of the MACD series) needs enough MACD history first
+        if self._count >= self.macd_slow_period + self.macd_signal_period:
             histogram = macd_line - signal_line
         else:
             signal_line = 0
@@ -127,40 +242,28 @@ class TechnicalIndicators:
             'histogram': float(histogram)
         }
     
-    def _calculate_ema(self, prices: np.array, period: int) -> Optional[float]:
-        """Calculate Exponential Moving Average."""
-        if len(prices) < period:
-            return None
-            
-        alpha = 2.0 / (period + 1)
-        ema = prices[0]  # Start with first price
-        
-        for price in prices[1:]:
-            ema = alpha * price + (1 - alpha) * ema
-            
-        return float(ema)
-    
     def calculate_bollinger_bands(self) -> Optional[Dict[str, float]]:
         """Calculate Bollinger Bands."""
         if not self.use_technical_indicators:
             return None
             
-        if len(self.price_history) < self.bb_period:
+        if self._count < self.bb_period:
             return None
             
-        prices = np.array([point['price'] for point in self.price_history[-self.bb_period:]])
+        total, total_sq = self._window_sums[self.bb_period]
+        mean_offset = total / self.bb_period
+        sma = self._shift + mean_offset
+        variance = total_sq / self.bb_period - mean_offset * mean_offset
+        std = math.sqrt(variance) if variance > 0 else 0.0
         
-        sma = np.mean(prices)
-        std = np.std(prices)
-        
-        upper_band = sma + (self.bb_std_dev * std)
-        lower_band = sma - (self.bb_std_dev * std)
+        # Band half-width, shared by upper and lower bands
+        offset = self.bb_std_dev * std
         
         return {
-            'upper_band': float(upper_band),
-            'middle_band': float(sma),
-            'lower_band': float(lower_band),
-            'bandwidth': float(upper_band - lower_band)
+            'upper_band': sma + offset,
+            'middle_band': sma,
+            'lower_band': sma - offset,
+            'bandwidth': 2.0 * offset
         }
     
     def calculate_moving_averages(self) -> Optional[Dict[str, float]]:
@@ -170,21 +273,39 @@ class TechnicalIndicators:
             
         result = {}
         
-        if len(self.price_history) >= self.sma_short_period:
-            short_prices = [point['price'] for point in self.price_history[-self.sma_short_period:]]
-            result['sma_short'] = float(np.mean(short_prices))
+        if self._count >= self.sma_short_period:
+            result['sma_short'] = self._shift + self._window_sums[self.sma_short_period][0] / self.sma_short_period
             
-        if len(self.price_history) >= self.sma_long_period:
-            long_prices = [point['price'] for point in self.price_history[-self.sma_long_period:]]
-            result['sma_long'] = float(np.mean(long_prices))
+        if self._count >= self.sma_long_period:
+            result['sma_long'] = self._shift + self._window_sums[self.sma_long_period][0] / self.sma_long_period
         
         return result if result else None
     
+    def _refresh_all(self) -> Dict:
+        """Read every indicator once for the current tick (price-independent, so shared across callers)."""
+        cached_ticks, snapshot = self._indicator_cache
+        if cached_ticks == self._ticks:
+            return snapshot
+        
+        snapshot = {
+            'rsi': self.calculate_rsi(),
+            'macd': self.calculate_macd(),
+            'bollinger_bands': self.calculate_bollinger_bands(),
+            'moving_averages': self.calculate_moving_averages()
+        }
+        self._indicator_cache = (self._ticks, snapshot)
+        return snapshot
+    
     def get_trading_signals(self, current_price: float) -> Dict[str, str]:
         """Generate trading signals based on technical indicators."""
         if not self.use_technical_indicators:
             return {'status': 'DISABLED', 'message': 'Technical indicators disabled in YAML config'}
         
+        # BUY and SELL checks in the same tick share one computation
+        cached_ticks, cached_price, cached_signals = self._signal_cache
+        if cached_ticks == self._ticks and cached_price == current_price:
+            return cached_signals
+        
         signals = {
             'overall_signal': 'NEUTRAL',
             'rsi_signal': 'NEUTRAL',
@@ -194,8 +315,10 @@ class TechnicalIndicators:
             'details': {}
         }
         
+        indicators = self._refresh_all()
+        
         # RSI signals
-        rsi = self.calculate_rsi()
+        rsi = indicators['rsi']
         if rsi is not None:
             if rsi <= self.rsi_oversold:
                 signals['rsi_signal'] = 'BUY'
@@ -209,7 +332,7 @@ class TechnicalIndicators:
             }
         
         # MACD signals
-        macd = self.calculate_macd()
+        macd = indicators['macd']
         if macd is not None:
             if macd['histogram'] > 0 and macd['macd_line'] > macd['signal_line']:
                 signals['macd_signal'] = 'BUY'
@@ -219,7 +342,7 @@ class TechnicalIndicators:
             signals['details']['macd'] = macd
         
         # Bollinger Bands signals
-        bb = self.calculate_bollinger_bands()
+        bb = indicators['bollinger_bands']
         if bb is not None:
             if current_price <= bb['lower_band']:
                 signals['bb_signal'] = 'BUY'
@@ -229,7 +352,7 @@ class TechnicalIndicators:
             signals['details']['bollinger_bands'] = bb
         
         # Moving Average signals
-        ma = self.calculate_moving_averages()
+        ma = indicators['moving_averages']
         if ma is not None and 'sma_short' in ma and 'sma_long' in ma:
             if ma['sma_short'] > ma['sma_long']:
                 signals['ma_signal'] = 'BUY'
@@ -249,6 +372,7 @@ class TechnicalIndicators:
         elif sell_signals > buy_signals:
             signals['overall_signal'] = 'SELL'
         
+        self._signal_cache = (self._ticks, current_price, signals)
         return signals
     
     def should_allow_trading_by_indicators(self, current_price: float, side: str) -> Tuple[bool, str]:
@@ -276,12 +400,16 @@ class TechnicalIndicators:
                 'message': 'Technical indicators disabled in YAML configuration'
             }
         
-        current_price = self.price_history[-1]['price'] if self.price_history else 0
+        cached_ticks, cached_summary = self._summary_cache
+        if cached_ticks == self._ticks:
+            return cached_summary
+        
+        current_price = float(self._prices[self._head - 1]) if self._count else 0
         signals = self.get_trading_signals(current_price)
         
-        return {
+        summary = {
             'enabled': True,
-            'price_history_length': len(self.price_history),
+            'price_history_length': self._count,
             'signals': signals,
             'config': {
                 'rsi_oversold': self.rsi_oversold,
@@ -289,4 +417,6 @@ class TechnicalIndicators:
                 'rsi_period': self.rsi_period,
                 'macd_periods': f"{self.macd_fast_period}/{self.macd_slow_period}/{self.macd_signal_period}"
             }
-        }
\ No newline at end of file
+        }
+        self._summary_cache = (self._ticks, summary)
+        return summary
\ No newline at end of file
@@ -4,33 +4,73 @@ Handles saving trade history based on YAML configuration.
 """
 import csv
 import os
+import time
+import atexit
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+from common.formatting import csv_field
+
+
+@dataclass(slots=True)
+class Trade:
+    """A single saved trade, as written to trade_history.csv."""
+    timestamp: str
+    trade_id: str
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+    grid_level: int
+    order_id: str
+    pnl: float
+    fees: float
+    trade_type: str
+    notes: str
 
 
 class TradePersistence:
     """Handles saving and exporting trade data based on YAML configuration."""
     
+    # Pending CSV rows are written in one call once either limit is reached
+    CSV_BATCH_SIZE = 64
+    CSV_FLUSH_INTERVAL_SEC = 5.0
+    
     def __init__(self, config_manager, event_logger):
         self.cfg = config_manager
         self.logger = event_logger
         
         # Get logging configuration
-        logging_cfg = self.cfg.get_logging_config()
-        self.export_trades_csv = logging_cfg.get('export_trades_csv', True)
-        self.save_trades = self.cfg.get_performance_config().get('save_trades', True) if hasattr(self.cfg, 'get_performance_config') else True
-        self.log_directory = logging_cfg.get('log_directory', 'logs')
+        logging_cfg = self.cfg.logging
+        self.export_trades_csv = logging_cfg.export_trades_csv
+        self.save_trades = self.cfg.performance.save_trades if hasattr(self.cfg, 'performance') else True
+        self.log_directory = logging_cfg.log_directory
         
         # Ensure logs directory exists
         os.makedirs(self.log_directory, exist_ok=True)
         
-        # Trade history storage
+        # Trade history storage, plus running totals so summaries need no pass over it
         self.trade_history = []
+        self._total_pnl = 0.0
+        self._total_fees = 0.0
+        self._winning_trades = 0
+        self._losing_trades = 0
         self.csv_file_path = os.path.join(self.log_directory, 'trade_history.csv')
         
+        # Batched CSV writes: rows are pre-formatted and appended through one persistent handle
+        self._pending_rows = []
+        self._unwritten = b''  # Tail of a batch whose write failed part-way; retried first
+        self._last_csv_flush = time.monotonic()
+        self._csv_fd = None
+        self._reporter = None
+        
         # Initialize CSV file with headers if needed
         if self.export_trades_csv:
             self._initialize_csv_file()
+            # O_APPEND: each batch lands at end-of-file in a single write() call
+            self._csv_fd = os.open(self.csv_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            atexit.register(self.close)
     
     def _initialize_csv_file(self):
         """Initialize CSV file with headers if it doesn't exist."""
@@ -60,139 +100,111 @@ class TradePersistence:
         if not self.save_trades:
             return
         
+        # Defaults are only formatted when the caller didn't supply them
+        timestamp = trade_data.get('timestamp') or datetime.now().isoformat()
+        trade_id = trade_data.get('trade_id') or f"{trade_data.get('side')}_{trade_data.get('grid_level')}_{int(time.time())}"
+        
         # Standardize trade data
-        standardized_trade = {
-            'timestamp': trade_data.get('timestamp', datetime.now().isoformat()),
-            'trade_id': trade_data.get('trade_id', f"{trade_data.get('side')}_{trade_data.get('grid_level')}_{int(datetime.now().timestamp())}"),
-            'symbol': trade_data.get('symbol', 'BTCUSDT'),
-            'side': trade_data.get('side', 'UNKNOWN'),
-            'quantity': float(trade_data.get('quantity', 0)),
-            'price': float(trade_data.get('price', 0)),
-            'grid_level': trade_data.get('grid_level', 0),
-            'order_id': trade_data.get('order_id', ''),
-            'pnl': float(trade_data.get('pnl', 0)),
-            'fees': float(trade_data.get('fees', 0)),
-            'trade_type': trade_data.get('trade_type', 'GRID'),
-            'notes': trade_data.get('notes', '')
-        }
+        trade = Trade(
+            timestamp=timestamp,
+            trade_id=trade_id,
+            symbol=trade_data.get('symbol', 'BTCUSDT'),
+            side=trade_data.get('side', 'UNKNOWN'),
+            quantity=float(trade_data.get('quantity', 0)),
+            price=float(trade_data.get('price', 0)),
+            grid_level=trade_data.get('grid_level', 0),
+            order_id=trade_data.get('order_id', ''),
+            pnl=float(trade_data.get('pnl', 0)),
+            fees=float(trade_data.get('fees', 0)),
+            trade_type=trade_data.get('trade_type', 'GRID'),
+            notes=trade_data.get('notes', '')
+        )
         
         # Add to memory
-        self.trade_history.append(standardized_trade)
+        self.trade_history.append(trade)
+        self._total_pnl += trade.pnl
+        self._total_fees += trade.fees
+        if trade.pnl > 0:
+            self._winning_trades += 1
+        elif trade.pnl < 0:
+            self._losing_trades += 1
         
         # Export to CSV if enabled
         if self.export_trades_csv:
-            self._append_to_csv(standardized_trade)
+            self._append_to_csv(trade)
         
         # Log the save
         self.logger.log_signal("trade_saved", {
-            "trade_id": standardized_trade['trade_id'],
-            "side": standardized_trade['side'],
-            "price": standardized_trade['price'],
-            "pnl": standardized_trade['pnl']
+            "trade_id": trade.trade_id,
+            "side": trade.side,
+            "price": trade.price,
+            "pnl": trade.pnl
         })
     
-    def _append_to_csv(self, trade_data: Dict):
-        """Append a single trade to the CSV file."""
+    def _append_to_csv(self, trade: Trade):
+        """Queue a single trade row for the CSV file."""
+        # Numeric fields are floats (same repr csv.writer uses); only text fields need quoting
+        self._pending_rows.append(
+            f"{csv_field(trade.timestamp)},{csv_field(trade.trade_id)},{csv_field(trade.symbol)},"
+            f"{csv_field(trade.side)},{trade.quantity},{trade.price},{csv_field(trade.grid_level)},"
+            f"{csv_field(trade.order_id)},{trade.pnl},{trade.fees},{csv_field(trade.trade_type)},"
+            f"{csv_field(trade.notes)}\r\n"
+        )
+        
+        if (len(self._pending_rows) >= self.CSV_BATCH_SIZE
+                or time.monotonic() - self._last_csv_flush >= self.CSV_FLUSH_INTERVAL_SEC):
+            self.flush()
+    
+    def flush(self):
+        """Write all pending trade rows to the CSV file."""
+        self._last_csv_flush = time.monotonic()
+        if not (self._pending_rows or self._unwritten) or self._csv_fd is None:
+            return
+        
+        # Rows move into the byte buffer before writing, so a failed write keeps only
+        # the bytes that never reached the file and a retry doesn't duplicate rows
+        data = memoryview(self._unwritten + ''.join(self._pending_rows).encode())
+        self._pending_rows.clear()
         try:
-            with open(self.csv_file_path, 'a', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow([
-                    trade_data['timestamp'],
-                    trade_data['trade_id'], 
-                    trade_data['symbol'],
-                    trade_data['side'],
-                    trade_data['quantity'],
-                    trade_data['price'],
-                    trade_data['grid_level'],
-                    trade_data['order_id'],
-                    trade_data['pnl'],
-                    trade_data['fees'],
-                    trade_data['trade_type'],
-                    trade_data['notes']
-                ])
+            while data:
+                data = data[os.write(self._csv_fd, data):]
         except Exception as e:
             self.logger.log_error("Failed to write trade to CSV", {
                 "error": str(e),
                 "csv_path": self.csv_file_path
             })
+        self._unwritten = bytes(data)
+    
+    def close(self):
+        """Write pending rows and close the CSV file descriptor."""
+        self.flush()
+        if self._csv_fd is not None:
+            os.close(self._csv_fd)
+            self._csv_fd = None
     
-    def get_trade_history(self, limit: int = None) -> List[Dict]:
+    def get_trade_history(self, limit: int = None) -> List[Trade]:
         """Get trade history from memory."""
         if limit:
             return self.trade_history[-limit:]
         return self.trade_history.copy()
     
-    def get_performance_summary(self) -> Dict:
-        """Get basic performance summary from saved trades."""
-        if not self.trade_history:
-            return {
-                'total_trades': 0,
-                'total_pnl': 0,
-                'winning_trades': 0,
-                'losing_trades': 0,
-                'win_rate': 0,
-                'total_fees': 0
-            }
-        
-        total_trades = len(self.trade_history)
-        total_pnl = sum(trade['pnl'] for trade in self.trade_history)
-        total_fees = sum(trade['fees'] for trade in self.trade_history)
-        winning_trades = len([t for t in self.trade_history if t['pnl'] > 0])
-        losing_trades = len([t for t in self.trade_history if t['pnl'] < 0])
-        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-        
-        return {
-            'total_trades': total_trades,
-            'total_pnl': total_pnl,
-            'winning_trades': winning_trades,
-            'losing_trades': losing_trades,
-            'win_rate': win_rate,
-            'total_fees': total_fees,
-            'avg_pnl_per_trade': total_pnl / total_trades if total_trades > 0 else 0,
-            'csv_file_path': self.csv_file_path if self.export_trades_csv else None
-        }
+    def session_totals(self) -> Tuple[int, float, float, int, int]:
+        """(total_trades, total_pnl, total_fees, winning_trades, losing_trades) for trades saved this session."""
+        return (len(self.trade_history), self._total_pnl, self._total_fees,
+                self._winning_trades, self._losing_trades)
+    
+    @property
+    def reporter(self):
+        """Reporting helper for this persistence instance, created on first use."""
+        if self._reporter is None:
+            from analytics.trade_reporter import TradeReporter
+            self._reporter = TradeReporter(self)
+        return self._reporter
+    
+    def get_performance_summary(self, include_csv_history: bool = False) -> Dict:
+        """Get basic performance summary from saved trades (see TradeReporter)."""
+        return self.reporter.get_performance_summary(include_csv_history)
     
     def export_performance_report(self, file_path: str = None):
-        """Export a detailed performance report to CSV."""
-        if not file_path:
-            file_path = os.path.join(self.log_directory, f'performance_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv')
-        
-        summary = self.get_performance_summary()
-        
-        with open(file_path, 'w', newline='') as file:
-            writer = csv.writer(file)
-            
-            # Write summary section
-            writer.writerow(['PERFORMANCE SUMMARY'])
-            writer.writerow(['Metric', 'Value'])
-            writer.writerow(['Total Trades', summary['total_trades']])
-            writer.writerow(['Total P&L', f"${summary['total_pnl']:.2f}"])
-            writer.writerow(['Winning Trades', summary['winning_trades']])
-            writer.writerow(['Losing Trades', summary['losing_trades']])
-            writer.writerow(['Win Rate', f"{summary['win_rate']:.1f}%"])
-            writer.writerow(['Total Fees', f"${summary['total_fees']:.2f}"])
-            writer.writerow(['Avg P&L per Trade', f"${summary['avg_pnl_per_trade']:.2f}"])
-            writer.writerow([])
-            
-            # Write detailed trades
-            writer.writerow(['DETAILED TRADES'])
-            writer.writerow(['Timestamp', 'Side', 'Price', 'Quantity', 'P&L', 'Grid Level', 'Type'])
-            
-            for trade in self.trade_history:
-                writer.writerow([
-                    trade['timestamp'],
-                    trade['side'],
-                    f"${trade['price']:.2f}",
-                    f"{trade['quantity']:.6f}",
-                    f"${trade['pnl']:.2f}",
-                    trade['grid_level'],
-                    trade['trade_type']
-                ])
-        
-        self.logger.log_signal("performance_report_exported", {
-            "file_path": file_path,
-            "total_trades": summary['total_trades'],
-            "total_pnl": summary['total_pnl']
-        })
-        
-        return file_path
\ No newline at end of file
+        """Export a detailed performance report to CSV (see TradeReporter)."""
+        return self.reporter.export_performance_report(file_path)
@@ -0,0 +1,157 @@
+"""
+Trade performance summaries and report export.
+Cold-path reporting split out of TradePersistence, which keeps only the per-trade save path.
+"""
+import csv
+import os
+import numpy as np
+from datetime import datetime
+from typing import Dict
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _summarize_columns(pnl, fees):
+        """Single compiled pass: (total_pnl, total_fees, winning_trades, losing_trades)."""
+        total_pnl = 0.0
+        total_fees = 0.0
+        wins = 0
+        losses = 0
+        for i in range(pnl.shape[0]):
+            p = pnl[i]
+            total_pnl += p
+            total_fees += fees[i]
+            if p > 0.0:
+                wins += 1
+            elif p < 0.0:
+                losses += 1
+        return total_pnl, total_fees, wins, losses
+else:
+    _summarize_columns = None
+
+
+class TradeReporter:
+    """Builds summaries and reports from a TradePersistence instance's trades."""
+    
+    def __init__(self, persistence):
+        self.persistence = persistence
+    
+    def load_history_bulk(self):
+        """
+        Load the side/pnl/fees columns of trade_history.csv (all sessions) in one columnar parse.
+        Returns a pandas DataFrame; empty if the file doesn't exist yet.
+        """
+        import pandas as pd
+        
+        self.persistence.flush()
+        columns = ['side', 'pnl', 'fees']
+        if not os.path.exists(self.persistence.csv_file_path):
+            return pd.DataFrame(columns=columns)
+        
+        return pd.read_csv(
+            self.persistence.csv_file_path,
+            usecols=columns,
+            dtype={'pnl': 'float64', 'fees': 'float64', 'side': 'category'}
+        )
+    
+    def get_performance_summary(self, include_csv_history: bool = False) -> Dict:
+        """
+        Get basic performance summary from saved trades.
+        With include_csv_history=True, summarize every trade in the CSV file instead of this session's.
+        """
+        if include_csv_history:
+            history = self.load_history_bulk()
+            pnl = history['pnl'].to_numpy(dtype=np.float64)
+            fees = history['fees'].to_numpy(dtype=np.float64)
+            total_trades = len(pnl)
+            if _summarize_columns is not None:
+                total_pnl, total_fees, winning_trades, losing_trades = _summarize_columns(pnl, fees)
+            else:
+                total_pnl = float(pnl.sum())
+                total_fees = float(fees.sum())
+                winning_trades = int(np.count_nonzero(pnl > 0))
+                losing_trades = int(np.count_nonzero(pnl < 0))
+        else:
+            # Totals are accumulated in save_trade()
+            total_trades, total_pnl, total_fees, winning_trades, losing_trades = self.persistence.session_totals()
+        
+        if total_trades == 0:
+            return {
+                'total_trades': 0,
+                'total_pnl': 0,
+                'winning_trades': 0,
+                'losing_trades': 0,
+                'win_rate': 0,
+                'total_fees': 0
+            }
+        
+        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+        
+        return {
+            'total_trades': total_trades,
+            'total_pnl': total_pnl,
+            'winning_trades': winning_trades,
+            'losing_trades': losing_trades,
+            'win_rate': win_rate,
+            'total_fees': total_fees,
+            'avg_pnl_per_trade': total_pnl / total_trades if total_trades > 0 else 0,
+            'csv_file_path': self.persistence.csv_file_path if self.persistence.export_trades_csv else None
+        }
+    
+    def _trade_details_frame(self):
+        """Trade detail rows for the performance report, formatted column-wise."""
+        import pandas as pd
+        
+        trades = self.persistence.trade_history
+        return pd.DataFrame({
+            'timestamp': [t.timestamp for t in trades],
+            'side': [t.side for t in trades],
+            'price': np.char.mod('$%.2f', np.fromiter((t.price for t in trades), np.float64, len(trades))),
+            'quantity': np.char.mod('%.6f', np.fromiter((t.quantity for t in trades), np.float64, len(trades))),
+            'pnl': np.char.mod('$%.2f', np.fromiter((t.pnl for t in trades), np.float64, len(trades))),
+            'grid_level': pd.Series([t.grid_level for t in trades], dtype=object),
+            'trade_type': [t.trade_type for t in trades]
+        })
+    
+    def export_performance_report(self, file_path: str = None):
+        """Export a detailed performance report to CSV."""
+        if not file_path:
+            file_path = os.path.join(self.persistence.log_directory, f'performance_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv')
+        
+        summary = self.get_performance_summary()
+        self.persistence.flush()
+        
+        with open(file_path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            
+            # Write summary section
+            writer.writerow(['PERFORMANCE SUMMARY'])
+            writer.writerow(['Metric', 'Value'])
+            writer.writerow(['Total Trades', summary['total_trades']])
+            writer.writerow(['Total P&L', f"${summary['total_pnl']:.2f}"])
+            writer.writerow(['Winning Trades', summary['winning_trades']])
+            writer.writerow(['Losing Trades', summary['losing_trades']])
+            writer.writerow(['Win Rate', f"{summary['win_rate']:.1f}%"])
+            writer.writerow(['Total Fees', f"${summary['total_fees']:.2f}"])
+            writer.writerow(['Avg P&L per Trade', f"${summary['avg_pnl_per_trade']:.2f}"])
+            writer.writerow([])
+            
+            # Write detailed trades
+            writer.writerow(['DETAILED TRADES'])
+            writer.writerow(['Timestamp', 'Side', 'Price', 'Quantity', 'P&L', 'Grid Level', 'Type'])
+            
+            if self.persistence.trade_history:
+                self._trade_details_frame().to_csv(file, header=False, index=False, lineterminator='\r\n')
+        
+        self.persistence.logger.log_signal("performance_report_exported", {
+            "file_path": file_path,
+            "total_trades": summary['total_trades'],
+            "total_pnl": summary['total_pnl']
+        })
+        
+        return file_path
\ No newline at end of file
@@ -2,7 +2,8 @@
 Volume filtering based on YAML configuration.
 Validates market conditions before allowing trades.
 """
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 
 
 class VolumeFilter:
@@ -18,9 +19,8 @@ class VolumeFilter:
         self.volume_filter_enabled = advanced_cfg.get('volume_filter', True)
         self.min_volume_24h = advanced_cfg.get('min_volume_24h', 1000000)
         
-        # Cache for volume data (to avoid excessive API calls)
+        # Cache for volume data (to avoid excessive API calls): symbol -> (monotonic expiry, data)
         self.volume_cache = {}
-        self.cache_expiry = None
         self.cache_duration_minutes = 5  # Cache volume data for 5 minutes
     
     def should_allow_trading(self, symbol='BTCUSDT'):
@@ -61,13 +61,12 @@ class VolumeFilter:
     
     def _get_24h_volume_data(self, symbol):
         """Get 24h volume data with caching to reduce API calls."""
-        now = datetime.now()
-        
-        # Check if we have valid cached data
-        if (self.cache_expiry and now < self.cache_expiry and 
-            symbol in self.volume_cache):
-            return self.volume_cache[symbol]
+        # Check if we have valid cached data (monotonic clock, per-symbol expiry)
+        cached = self.volume_cache.get(symbol)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
         
+        now = datetime.now()
         try:
             # Get 24h ticker statistics
             ticker_24h = self.client.get_ticker(symbol=symbol)
@@ -83,8 +82,7 @@ class VolumeFilter:
             }
             
             # Cache the data
-            self.volume_cache[symbol] = volume_data
-            self.cache_expiry = now + timedelta(minutes=self.cache_duration_minutes)
+            self.volume_cache[symbol] = (time.monotonic() + self.cache_duration_minutes * 60, volume_data)
             
             return volume_data
             
@@ -0,0 +1,38 @@
+"""
+Dependency-free text formatting helpers shared by the log and persistence writers.
+"""
+import time
+
+
+def csv_field(value) -> str:
+    """Format one CSV field the way csv.writer would (None -> empty, quote only if needed)."""
+    if value is None:
+        return ''
+    text = str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+# (second, ISO prefix) for the most recent second seen by iso_from_ns(); replaced as one tuple
+# so threads formatting timestamps concurrently never see a mismatched pair
+_LAST_SEC = (None, "")
+
+
+def iso_from_ns(ns: int) -> str:
+    """
+    Local-time ISO timestamp (microsecond precision) for a time.time_ns() value.
+    The per-second prefix is formatted once and reused for every timestamp in that second.
+    """
+    global _LAST_SEC
+    sec = ns // 1_000_000_000
+    cached_sec, prefix = _LAST_SEC
+    if sec != cached_sec:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+        _LAST_SEC = (sec, prefix)
+    return f"{prefix}.{(ns // 1000) % 1_000_000:06d}"
+
+
+def now_iso() -> str:
+    """Current local time as an ISO string; cheaper than datetime.now().isoformat() per call."""
+    return iso_from_ns(time.time_ns())
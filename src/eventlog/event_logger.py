@@ -1,53 +1,148 @@
 import os
 import csv
 import json
+import time
+import atexit
 import logging
+import threading
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from logging.handlers import RotatingFileHandler
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Imported as src.eventlog.event_logger (e.g. by test_feature) when src/ isn't on sys.path
+try:
+    from common.formatting import csv_field, iso_from_ns
+except ImportError:
+    from src.common.formatting import csv_field, iso_from_ns
+
+# Most buffers one writev() call accepts
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') else 1024
+
+
+def _write_all(fd: int, buffers: List[bytes]):
+    """Write buffers to fd in order: gathered writev() calls where available, retrying partial writes."""
+    if not hasattr(os, 'writev'):
+        data = memoryview(b"".join(buffers))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+    
+    buffers = list(buffers)
+    i = 0
+    while i < len(buffers):
+        written = os.writev(fd, buffers[i:i + _IOV_MAX])
+        while i < len(buffers) and written >= len(buffers[i]):
+            written -= len(buffers[i])
+            i += 1
+        if written:
+            buffers[i] = buffers[i][written:]
+
+
+def _json_default(value):
+    """Encode values the JSON serializer doesn't handle itself (pandas/numpy leftovers, datetime, anything else as str)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    elif hasattr(value, 'tolist'):  # numpy arrays and scalars
+        return value.tolist()
+    elif hasattr(value, 'item'):  # pandas scalars
+        return value.item()
+    return str(value)
+
+
+def _json_dumps(data, indent: bool = False) -> bytes:
+    """Compact (or 2-space indented) JSON bytes (orjson, with native numpy support, when available)."""
+    if orjson:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    if indent:
+        return json.dumps(data, indent=2, default=_json_default).encode()
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode()
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that checks the file size every ROLLOVER_CHECK_INTERVAL records
+    (and on the first one) instead of seeking/stat-ing on every record.
+    """
+    
+    ROLLOVER_CHECK_INTERVAL = 4096
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._records_until_check = 1
+    
+    def shouldRollover(self, record):
+        self._records_until_check -= 1
+        if self._records_until_check > 0:
+            return False
+        self._records_until_check = self.ROLLOVER_CHECK_INTERVAL
+        return super().shouldRollover(record)
+
+
 class EventLogger:
     """
     Enhanced event logger for comprehensive grid trading monitoring.
     Supports multiple log formats, rotation, and advanced analytics.
     """
     
-    def _convert_for_json(self, value):
-        """Convert numpy/pandas types and datetime to JSON serializable types"""
-        import numpy as np
-        from datetime import datetime
-        
-        if isinstance(value, dict):
-            return {k: self._convert_for_json(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self._convert_for_json(v) for v in value]
-        elif isinstance(value, datetime):
-            return value.isoformat()
-        elif isinstance(value, np.integer):
-            return int(value)
-        elif isinstance(value, np.floating):
-            return float(value)
-        elif isinstance(value, np.ndarray):
-            return value.tolist()
-        elif hasattr(value, 'item'):  # pandas scalars
-            return value.item()
-        return value
+    CSV_HEADER = (
+        "timestamp", "session_id", "event_type", "event_subtype",
+        "symbol", "side", "quantity", "price", "order_id",
+        "grid_level", "cycle_id", "pnl", "fee", "fee_asset",
+        "risk_level", "message", "data_json", "error"
+    )
+    
+    # Precompiled row template; fields are pre-escaped by csv_field
+    CSV_ROW_FORMAT = ",".join(["%s"] * len(CSV_HEADER)) + "\r\n"
+    
+    # Event data keys that fill a CSV column and are left out of data_json
+    CSV_COLUMN_INDEX = {
+        "symbol": 4, "side": 5, "quantity": 6, "price": 7, "order_id": 8, "level": 9,
+        "cycle_id": 10, "pnl": 11, "fee": 12, "fee_asset": 13, "severity": 14, "message": 15
+    }
+    
+    # Keys that fill a column (unless the preferred key is present) and also stay in data_json
+    CSV_SHARED_COLUMNS = {
+        "grid_level": (9, "level"), "net_profit": (11, "pnl"), "fees_paid": (12, "fee"),
+        "risk_level": (14, "severity"), "error": (17, None)
+    }
+    
+    # Queued events are written by a background thread every FLUSH_INTERVAL_SEC, or sooner
+    # once FLUSH_BATCH_SIZE are waiting (errors are written immediately). If the flusher falls
+    # EVENT_QUEUE_MAXLEN events behind, the logging caller flushes itself instead of dropping any.
+    FLUSH_INTERVAL_SEC = 0.05
+    FLUSH_BATCH_SIZE = 1000
+    EVENT_QUEUE_MAXLEN = 100_000
+    
+    # Events kept in memory for get_recent_events() / get_risk_summary()
+    RECENT_EVENTS_CAPACITY = 10_000
+    RECENT_RISK_CAPACITY = 1024
     
     def __init__(self, config_manager=None, log_dir="logs", log_filename="events.csv"):
         self.config = config_manager
         
         # Load logging configuration from YAML
-        if config_manager and hasattr(config_manager, 'get_logging_config'):
-            log_cfg = config_manager.get_logging_config()
-            self.log_dir = log_cfg.get('log_directory', 'logs')
-            self.max_log_size_mb = log_cfg.get('max_log_size_mb', 50)
-            self.backup_count = log_cfg.get('backup_count', 5)
-            self.main_log_level = log_cfg.get('main_log_level', 'INFO')
-            self.console_log_level = log_cfg.get('console_log_level', 'INFO')
-            self.enable_email_alerts = log_cfg.get('enable_email_alerts', False)
-            self.create_performance_charts = log_cfg.get('create_performance_charts', True)
-            self.export_trades_csv = log_cfg.get('export_trades_csv', True)
-            self.real_time_monitoring = log_cfg.get('real_time_monitoring', True)
+        if config_manager and hasattr(config_manager, 'logging'):
+            log_cfg = config_manager.logging
+            self.log_dir = log_cfg.log_directory
+            self.max_log_size_mb = log_cfg.max_log_size_mb
+            self.backup_count = log_cfg.backup_count
+            self.main_log_level = log_cfg.main_log_level
+            self.console_log_level = log_cfg.console_log_level
+            self.enable_email_alerts = log_cfg.enable_email_alerts
+            self.create_performance_charts = log_cfg.create_performance_charts
+            self.export_trades_csv = log_cfg.export_trades_csv
+            self.real_time_monitoring = log_cfg.real_time_monitoring
+            self.log_signals = log_cfg.log_signals
+            self.event_csv_realtime = log_cfg.event_csv_realtime
         else:
             # Default values if no config manager
             self.log_dir = log_dir
@@ -59,25 +154,62 @@ class EventLogger:
             self.create_performance_charts = True
             self.export_trades_csv = True
             self.real_time_monitoring = True
+            self.log_signals = True
+            self.event_csv_realtime = False
         
         os.makedirs(self.log_dir, exist_ok=True)
         
         # Initialize multiple log files
         self.csv_file = os.path.join(self.log_dir, log_filename)
+        # Single NDJSON sink; risk and performance records carry an "event_class" field
         self.json_file = os.path.join(self.log_dir, "events.json")
-        self.performance_file = os.path.join(self.log_dir, "performance.json")
-        self.risk_file = os.path.join(self.log_dir, "risk_events.json")
+        
+        # Older versions kept this as one JSON array; convert it to one event per line
+        self._migrate_json_array_to_ndjson(self.json_file)
         
         # Initialize structured logging
         self._init_structured_logging()
         self._init_csv_file()
         
+        # Persistent handles instead of open/write/close per event. events.json is only written
+        # by the flusher, a whole batch per gathered write, so it uses a raw O_APPEND descriptor
+        self._csv_fh = None
+        self._json_fd = os.open(self.json_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        
+        # Per-type counts of rows written to events.csv this session
+        self._csv_counts = {"trade": 0, "signal": 0, "error": 0, "risk": 0, "grid": 0, "cycle": 0}
+        
+        # events.json is the primary log. This instance's own rows go to events.csv from the
+        # flusher thread; with event_csv_realtime they reach the file every batch, otherwise
+        # they sit in a large write buffer that is pushed out when full and at close()
+        if self.export_trades_csv:
+            buffering = 64 * 1024 if self.event_csv_realtime else 1024 * 1024
+            self._csv_fh = open(self.csv_file, "a", newline='', buffering=buffering)
+        
         # Performance tracking
         self.session_start = datetime.now()
+        self.session_start_ns = time.monotonic_ns()
+        self.session_id = self.session_start.strftime('%Y%m%d_%H%M%S')
         self.events_count = {
             'trades': 0, 'signals': 0, 'errors': 0, 'risk_alerts': 0,
             'grid_operations': 0, 'cycle_completions': 0
         }
+        
+        # Recent events (queue tuples) and (epoch seconds, risk event), oldest first, so queries never touch the disk
+        self._recent = deque(maxlen=self.RECENT_EVENTS_CAPACITY)
+        self._recent_risk = deque(maxlen=self.RECENT_RISK_CAPACITY)
+        
+        # Pre-serialized JSON envelope per (event_type, event_subtype, session_id)
+        self._envelope_cache = {}
+        
+        # Events are queued by the log_* calls and written in batches by one background thread
+        self._queue = deque()
+        self._write_lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._drain_loop, name="EventLoggerFlusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
 
     def _init_structured_logging(self):
         """Initialize structured logging with YAML configuration."""
@@ -91,7 +223,7 @@ class EventLogger:
         # Create rotating file handler with YAML settings
         log_file = os.path.join(self.log_dir, 'grid_trading.log')
         max_bytes = self.max_log_size_mb * 1024 * 1024
-        handler = RotatingFileHandler(
+        handler = BatchedRotatingFileHandler(
             log_file, maxBytes=max_bytes, backupCount=self.backup_count
         )
         
@@ -109,6 +241,9 @@ class EventLogger:
         console_handler.setFormatter(formatter)
         self.logger.addHandler(console_handler)
         
+        # Bound once; the log_* methods call it on every event
+        self._log_info = self.logger.info
+        
         # Log configuration loaded
         self.logger.info(f"Logging configured: Main={self.main_log_level}, Console={self.console_log_level}")
         self.logger.info(f"Log directory: {self.log_dir}, Max size: {self.max_log_size_mb}MB, Backup count: {self.backup_count}")
@@ -118,63 +253,140 @@ class EventLogger:
         if not os.path.exists(self.csv_file):
             with open(self.csv_file, "w", newline='') as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    "timestamp", "session_id", "event_type", "event_subtype",
-                    "symbol", "side", "quantity", "price", "order_id",
-                    "grid_level", "cycle_id", "pnl", "fee", "fee_asset",
-                    "risk_level", "message", "data_json", "error"
-                ])
+                writer.writerow(self.CSV_HEADER)
+    
+    def _migrate_json_array_to_ndjson(self, path: str):
+        """Rewrite a legacy JSON-array event file as NDJSON (one event per line)."""
+        try:
+            with open(path, "r") as f:
+                if f.read(1) != "[":
+                    return
+                f.seek(0)
+                events = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        
+        with open(path, "wb") as f:
+            f.writelines(_json_dumps(event) + b"\n" for event in events)
+    
+    def _drain_loop(self):
+        """Background thread: write queued events every FLUSH_INTERVAL_SEC until stopped."""
+        while not self._stop.is_set():
+            self._wake.wait(self.FLUSH_INTERVAL_SEC)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"Event log flush failed: {e}")
+    
+    def flush(self):
+        """Write all queued events and push buffered rows to the log files."""
+        with self._write_lock:
+            while self._queue:
+                batch = []
+                while self._queue and len(batch) < self.FLUSH_BATCH_SIZE:
+                    batch.append(self._queue.popleft())
+                self._write_batch(batch)
+            if self._csv_fh is not None and self.event_csv_realtime:
+                self._csv_fh.flush()
+    
+    def close(self):
+        """Stop the flusher thread, write remaining events and close the log files (also registered with atexit)."""
+        self._stop.set()
+        self._wake.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        with self._write_lock:
+            self.flush()
+            if self._csv_fh is not None:
+                self._csv_fh.close()
+            if self._json_fd is not None:
+                os.close(self._json_fd)
+            self._csv_fh = None
+            self._json_fd = None
 
     def log_trade(self, trade_data: Dict[str, Any]):
         """Log trading events with enhanced data."""
         self.events_count['trades'] += 1
         self._write_enhanced_event("trade", "execution", trade_data)
-        self.logger.info(f"TRADE: {trade_data.get('side', 'N/A')} {trade_data.get('quantity', 0)} at ${trade_data.get('price', 0)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log_info("TRADE: %s %s at $%s", trade_data.get('side', 'N/A'),
+                           trade_data.get('quantity', 0), trade_data.get('price', 0))
+
+    def log_trades_batch(self, trades: List[Dict[str, Any]]):
+        """Log several trades in one call (one queue extend, one summary log line)."""
+        if not trades:
+            return
+        self.events_count['trades'] += len(trades)
+        if self.export_trades_csv:
+            self._csv_counts["trade"] = self._csv_counts.get("trade", 0) + len(trades)
+        
+        ts_ns = time.time_ns()
+        events = [("trade", "execution", dict(trade), ts_ns, self.session_id) for trade in trades]
+        self._queue.extend(events)
+        self._recent.extend(events)
+        if len(self._queue) >= self.EVENT_QUEUE_MAXLEN:
+            self.flush()
+        elif len(self._queue) >= self.FLUSH_BATCH_SIZE:
+            self._wake.set()
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            last = trades[-1]
+            self._log_info("TRADES: %d executed, last %s %s at $%s", len(trades), last.get('side', 'N/A'),
+                           last.get('quantity', last.get('qty', 0)), last.get('price', 0))
 
     def log_grid_operation(self, operation_type: str, data: Dict[str, Any]):
         """Log grid-specific operations."""
         self.events_count['grid_operations'] += 1
         self._write_enhanced_event("grid", operation_type, data)
-        self.logger.info(f"GRID_{operation_type.upper()}: {data.get('message', 'Grid operation executed')}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log_info("GRID_%s: %s", operation_type.upper(), data.get('message', 'Grid operation executed'))
 
     def log_cycle_event(self, cycle_event: str, data: Dict[str, Any]):
         """Log trading cycle events."""
         if cycle_event == 'completed':
             self.events_count['cycle_completions'] += 1
         self._write_enhanced_event("cycle", cycle_event, data)
-        self.logger.info(f"CYCLE_{cycle_event.upper()}: {data.get('message', f'Cycle {cycle_event}')}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log_info("CYCLE_%s: %s", cycle_event.upper(), data.get('message', f'Cycle {cycle_event}'))
 
     def log_risk_event(self, risk_type: str, data: Dict[str, Any]):
         """Log risk management events."""
         self.events_count['risk_alerts'] += 1
         risk_level = data.get('severity', 'MEDIUM')
         
-        # Write to risk-specific log
+        # Risk events go to their own log only
         self._write_risk_event(risk_type, data)
         
-        # Write to main event log
-        self._write_enhanced_event("risk", risk_type, data)
-        
         # Log with appropriate level
         if risk_level == 'CRITICAL':
-            self.logger.critical(f"RISK_CRITICAL: {data.get('message', 'Critical risk event')}")
+            self.logger.critical("RISK_CRITICAL: %s", data.get('message', 'Critical risk event'))
         elif risk_level == 'HIGH':
-            self.logger.error(f"RISK_HIGH: {data.get('message', 'High risk event')}")
+            self.logger.error("RISK_HIGH: %s", data.get('message', 'High risk event'))
         else:
-            self.logger.warning(f"RISK_{risk_level}: {data.get('message', 'Risk event')}")
+            self.logger.warning("RISK_%s: %s", risk_level, data.get('message', 'Risk event'))
 
     def log_performance_event(self, perf_type: str, data: Dict[str, Any]):
         """Log performance-related events."""
         self._write_performance_event(perf_type, data)
-        self._write_enhanced_event("performance", perf_type, data)
-        self.logger.info(f"PERFORMANCE_{perf_type.upper()}: {data.get('message', 'Performance event')}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log_info("PERFORMANCE_%s: %s", perf_type.upper(), data.get('message', 'Performance event'))
 
+    def enabled_for(self, kind: str) -> bool:
+        """Check whether events of this kind are recorded, so callers can skip building payloads."""
+        if kind == 'signal':
+            return self.log_signals
+        return True
+    
     def log_signal(self, signal_type: str, data: Dict[str, Any]):
         """Enhanced signal logging."""
+        if not self.log_signals:
+            return
         self.events_count['signals'] += 1
         enhanced_data = {"signal_type": signal_type, **data}
         self._write_enhanced_event("signal", signal_type, enhanced_data)
-        self.logger.info(f"SIGNAL_{signal_type.upper()}: {data.get('message', 'Signal generated')}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log_info("SIGNAL_%s: %s", signal_type.upper(), data.get('message', 'Signal generated'))
 
     def log_error(self, error_info: Any, context: Dict[str, Any] = None):
         """Enhanced error logging with context."""
@@ -192,88 +404,87 @@ class EventLogger:
         }
         
         self._write_enhanced_event("error", "exception", error_data)
-        self.logger.error(f"ERROR: {error_msg}")
+        self.logger.error("ERROR: %s", error_msg)
 
     def _write_enhanced_event(self, event_type: str, event_subtype: str, data: Dict[str, Any]):
-        """Write event to enhanced CSV format."""
-        timestamp = datetime.now()
-        session_id = getattr(self, 'session_id', timestamp.strftime('%Y%m%d_%H%M%S'))
-        
-        # Enhanced row structure
-        row = {
-            "timestamp": timestamp.isoformat(),
-            "session_id": session_id,
-            "event_type": event_type,
-            "event_subtype": event_subtype,
-            "symbol": data.get("symbol", ""),
-            "side": data.get("side", ""),
-            "quantity": data.get("quantity", ""),
-            "price": data.get("price", ""),
-            "order_id": data.get("order_id", ""),
-            "grid_level": data.get("level", data.get("grid_level", "")),
-            "cycle_id": data.get("cycle_id", ""),
-            "pnl": data.get("pnl", data.get("net_profit", "")),
-            "fee": data.get("fee", data.get("fees_paid", "")),
-            "fee_asset": data.get("fee_asset", ""),
-            "risk_level": data.get("severity", data.get("risk_level", "")),
-            "message": data.get("message", ""),
-            "data_json": json.dumps({k: self._convert_for_json(v) for k, v in data.items() if k not in [
-                "symbol", "side", "quantity", "price", "order_id", "level", 
-                "cycle_id", "pnl", "fee", "fee_asset", "severity", "message"
-            ]}),
-            "error": data.get("error", "")
-        }
-        
-        # Write to CSV only if enabled in YAML config
+        """Queue an event for the CSV and JSON logs; the flusher thread writes it."""
         if self.export_trades_csv:
-            header = [
-                "timestamp", "session_id", "event_type", "event_subtype",
-                "symbol", "side", "quantity", "price", "order_id",
-                "grid_level", "cycle_id", "pnl", "fee", "fee_asset", 
-                "risk_level", "message", "data_json", "error"
-            ]
-            
-            with open(self.csv_file, "a", newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([row.get(h, "") for h in header])
+            self._csv_counts[event_type] = self._csv_counts.get(event_type, 0) + 1
+        
+        # Timestamp stays as integer ns until the flusher (or a query) formats it.
+        # Shallow copy so callers can reuse their dict before the flusher gets to it
+        event = (event_type, event_subtype, dict(data), time.time_ns(), self.session_id)
+        self._queue.append(event)
+        self._recent.append(event)
+        
+        if event_type == "error" or len(self._queue) >= self.EVENT_QUEUE_MAXLEN:
+            self.flush()
+        elif len(self._queue) >= self.FLUSH_BATCH_SIZE:
+            self._wake.set()
+    
+    def _write_batch(self, batch: List[tuple]):
+        """Write a batch of queued events: one write() to the CSV, one gathered writev() to the JSON log."""
+        rows = []
+        lines = []
+        for event_type, event_subtype, data, ts_ns, session_id in batch:
+            timestamp = iso_from_ns(ts_ns)
+            if self._csv_fh is not None:
+                rows.append(self._format_csv_row(event_type, event_subtype, data, timestamp, session_id))
+            lines.append(self._format_json_event(event_type, event_subtype, data, timestamp, session_id))
+        
+        if self._csv_fh is not None:
+            self._csv_fh.write("".join(rows))
         
         # Also write to JSON log
-        self._write_json_event(event_type, event_subtype, data, timestamp)
-
-    def _write_json_event(self, event_type: str, event_subtype: str, data: Dict[str, Any], timestamp: datetime):
-        """Write structured JSON event to proper JSON array."""
-        event = {
-            "timestamp": timestamp.isoformat(),
-            "session_id": getattr(self, 'session_id', timestamp.strftime('%Y%m%d_%H%M%S')),
-            "event_type": event_type,
-            "event_subtype": event_subtype,
-            "data": data
-        }
-        
-        # Convert all values to JSON serializable format
-        serializable_event = {k: self._convert_for_json(v) for k, v in event.items()}
-        
-        # Read existing events or initialize empty array
-        events = []
-        if os.path.exists(self.json_file):
-            try:
-                with open(self.json_file, "r") as f:
-                    content = f.read().strip()
-                    if content:
-                        events = json.loads(content)
-            except (json.JSONDecodeError, FileNotFoundError):
-                events = []
-        
-        # Add new event
-        events.append(serializable_event)
-        
-        # Write back as proper JSON array
-        with open(self.json_file, "w") as f:
-            json.dump(events, f, indent=2)
+        if self._json_fd is not None:
+            _write_all(self._json_fd, lines)
+    
+    def _format_csv_row(self, event_type: str, event_subtype: str, data: Dict[str, Any],
+                        timestamp: str, session_id: str) -> str:
+        """Build the enhanced CSV line for one event (same bytes csv.writer would produce)."""
+        fields = [timestamp, session_id, event_type, event_subtype] + [""] * 14
+        extras = {}
+        
+        # One pass over data: known keys go to their column, the rest to data_json
+        column_index = self.CSV_COLUMN_INDEX
+        shared_columns = self.CSV_SHARED_COLUMNS
+        for key, value in data.items():
+            idx = column_index.get(key)
+            if idx is not None:
+                fields[idx] = value
+                continue
+            extras[key] = value
+            shared = shared_columns.get(key)
+            if shared is not None and (shared[1] is None or shared[1] not in data):
+                fields[shared[0]] = value
+        
+        fields[16] = _json_dumps(extras).decode()
+        return self.CSV_ROW_FORMAT % tuple(map(csv_field, fields))
+
+    def _format_json_event(self, event_type: str, event_subtype: str, data: Dict[str, Any],
+                           timestamp: str, session_id: str) -> bytes:
+        """Structured JSON event as one NDJSON line; only timestamp and data are serialized per event."""
+        key = (event_type, event_subtype, session_id)
+        envelope = self._envelope_cache.get(key)
+        if envelope is None:
+            # ',"session_id":...,"event_type":...,"event_subtype":...,"data":' for this key
+            envelope = (b',"session_id":' + _json_dumps(session_id)
+                        + b',"event_type":' + _json_dumps(event_type)
+                        + b',"event_subtype":' + _json_dumps(event_subtype) + b',"data":')
+            self._envelope_cache[key] = envelope
+        return b'{"timestamp":"' + timestamp.encode() + b'"' + envelope + _json_dumps(data) + b'}\n'
+
+    def _append_ndjson(self, record: Dict[str, Any]):
+        """Append one record to events.json after any queued events, keeping the file in order."""
+        with self._write_lock:
+            self.flush()
+            if self._json_fd is not None:
+                _write_all(self._json_fd, [_json_dumps(record) + b"\n"])
 
     def _write_risk_event(self, risk_type: str, data: Dict[str, Any]):
-        """Write risk event to dedicated risk log."""
+        """Write risk event to the event log as a "risk" record."""
         risk_event = {
+            "event_class": "risk",
             "timestamp": datetime.now().isoformat(),
             "risk_type": risk_type,
             "severity": data.get("severity", "MEDIUM"),
@@ -283,55 +494,48 @@ class EventLogger:
             "action": data.get("action", "NONE"),
             "data": data
         }
-        
-        # Convert all values to JSON serializable format
-        serializable_event = {k: self._convert_for_json(v) for k, v in risk_event.items()}
-        
-        # Read existing events or initialize empty array
-        events = []
-        if os.path.exists(self.risk_file):
-            try:
-                with open(self.risk_file, "r") as f:
-                    content = f.read().strip()
-                    if content:
-                        events = json.loads(content)
-            except (json.JSONDecodeError, FileNotFoundError):
-                events = []
-        
-        # Add new event
-        events.append(serializable_event)
-        
-        # Write back as proper JSON array
-        with open(self.risk_file, "w") as f:
-            json.dump(events, f, indent=2)
+        self._recent_risk.append((time.time(), risk_event))
+        self._append_ndjson(risk_event)
 
     def _write_performance_event(self, perf_type: str, data: Dict[str, Any]):
-        """Write performance event to dedicated performance log."""
+        """Write performance event to the event log as a "performance" record."""
         perf_event = {
+            "event_class": "performance",
             "timestamp": datetime.now().isoformat(),
             "performance_type": perf_type,
             "metrics": data,
-            "session_duration": str(datetime.now() - self.session_start)
+            "session_duration_ns": time.monotonic_ns() - self.session_start_ns
         }
-        
-        with open(self.performance_file, "a") as f:
-            # Convert all values to JSON serializable format
-            serializable_event = {k: self._convert_for_json(v) for k, v in perf_event.items()}
-            f.write(json.dumps(serializable_event) + "\n")
+        self._append_ndjson(perf_event)
 
-    def generate_report(self) -> Dict[str, Any]:
-        """Generate comprehensive event report."""
-        session_duration = datetime.now() - self.session_start
-        
-        # Count events from CSV
-        csv_counts = {"trade": 0, "signal": 0, "error": 0, "risk": 0, "grid": 0, "cycle": 0}
-        if os.path.exists(self.csv_file):
-            with open(self.csv_file, "r") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    event_type = row.get("event_type", "")
-                    if event_type in csv_counts:
-                        csv_counts[event_type] += 1
+    def iter_class(self, event_class: str = "event", offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records of one class ("event", "risk" or "performance") from events.json.
+        Records without an "event_class" field are regular events.
+        """
+        self.flush()
+        with open(self.json_file, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    record = orjson.loads(line) if orjson else json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get("event_class", "event") == event_class:
+                    yield record
+
+    def _session_duration(self) -> timedelta:
+        """Elapsed session time from the monotonic clock."""
+        return timedelta(microseconds=(time.monotonic_ns() - self.session_start_ns) // 1000)
+
+    def generate_report(self, from_disk: bool = False) -> Dict[str, Any]:
+        """
+        Generate comprehensive event report.
+        csv_counts covers this session; from_disk=True counts every row in the CSV file instead.
+        """
+        session_duration = self._session_duration()
+        
+        csv_counts = self._scan_csv_counts() if from_disk else dict(self._csv_counts)
 
         return {
             "session_start": self.session_start.isoformat(),
@@ -342,59 +546,90 @@ class EventLogger:
             "log_files": {
                 "csv": self.csv_file,
                 "json": self.json_file,
-                "performance": self.performance_file,
-                "risk": self.risk_file,
                 "main_log": os.path.join(self.log_dir, 'grid_trading.log')
             }
         }
 
+    def _scan_csv_counts(self) -> Dict[str, int]:
+        """Count rows per event type in the existing CSV file."""
+        counts = {"trade": 0, "signal": 0, "error": 0, "risk": 0, "grid": 0, "cycle": 0}
+        with self._write_lock:
+            self.flush()
+            if self._csv_fh is not None:
+                self._csv_fh.flush()  # Buffered rows too, when not writing in real time
+        
+        # pyarrow reads and counts just the event_type column in C; fall back to a csv.reader pass
+        try:
+            import pyarrow.csv as pacsv
+            import pyarrow.compute as pc
+        except ImportError:
+            pacsv = None
+        
+        if pacsv is not None:
+            try:
+                table = pacsv.read_csv(
+                    self.csv_file,
+                    parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                    convert_options=pacsv.ConvertOptions(include_columns=["event_type"])
+                )
+            except FileNotFoundError:
+                return counts
+            except ValueError:  # ArrowInvalid, e.g. rows from an older column layout
+                table = None
+            if table is not None:
+                for item in pc.value_counts(table["event_type"]).to_pylist():
+                    if item["values"] in counts:
+                        counts[item["values"]] += item["counts"]
+                return counts
+        
+        # The file is created in __init__, so open it directly instead of stat-ing first
+        event_type_col = self.CSV_HEADER.index("event_type")
+        try:
+            with open(self.csv_file, "r", newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Header
+                for row in reader:
+                    if len(row) > event_type_col and row[event_type_col] in counts:
+                        counts[row[event_type_col]] += 1
+        except FileNotFoundError:
+            pass
+        return counts
+
     def get_recent_events(self, event_type: str = None, hours: int = 1) -> List[Dict[str, Any]]:
-        """Get recent events from JSON log."""
+        """Get this session's recent events (newest first) from the in-memory buffer."""
+        cutoff_ns = time.time_ns() - int(hours * 3600 * 1_000_000_000)
         events = []
-        if not os.path.exists(self.json_file):
-            return events
         
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        with open(self.json_file, "r") as f:
-            for line in f:
-                try:
-                    event = json.loads(line.strip())
-                    event_time = datetime.fromisoformat(event["timestamp"])
-                    
-                    if event_time > cutoff_time:
-                        if event_type is None or event["event_type"] == event_type:
-                            events.append(event)
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    continue
-        
-        return sorted(events, key=lambda x: x["timestamp"], reverse=True)
+        for ev_type, ev_subtype, data, ts_ns, session_id in reversed(self._recent):
+            if ts_ns <= cutoff_ns:
+                break
+            if event_type is None or ev_type == event_type:
+                events.append({
+                    "timestamp": iso_from_ns(ts_ns),
+                    "session_id": session_id,
+                    "event_type": ev_type,
+                    "event_subtype": ev_subtype,
+                    "data": data
+                })
+        
+        return events
 
     def get_risk_summary(self, hours: int = 24) -> Dict[str, Any]:
-        """Get risk events summary."""
-        if not os.path.exists(self.risk_file):
-            return {"total_risk_events": 0, "by_severity": {}, "by_type": {}}
-        
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        """Get risk events summary from the in-memory buffer."""
+        cutoff = time.time() - hours * 3600
         by_severity = {}
         by_type = {}
         total = 0
         
-        with open(self.risk_file, "r") as f:
-            for line in f:
-                try:
-                    event = json.loads(line.strip())
-                    event_time = datetime.fromisoformat(event["timestamp"])
-                    
-                    if event_time > cutoff_time:
-                        total += 1
-                        severity = event.get("severity", "UNKNOWN")
-                        risk_type = event.get("risk_type", "UNKNOWN")
-                        
-                        by_severity[severity] = by_severity.get(severity, 0) + 1
-                        by_type[risk_type] = by_type.get(risk_type, 0) + 1
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    continue
+        for event_time, event in reversed(self._recent_risk):
+            if event_time <= cutoff:
+                break
+            total += 1
+            severity = event.get("severity", "UNKNOWN")
+            risk_type = event.get("risk_type", "UNKNOWN")
+            
+            by_severity[severity] = by_severity.get(severity, 0) + 1
+            by_type[risk_type] = by_type.get(risk_type, 0) + 1
         
         return {
             "total_risk_events": total,
@@ -409,15 +644,16 @@ class EventLogger:
             "session_info": {
                 "start_time": self.session_start.isoformat(),
                 "end_time": datetime.now().isoformat(),
-                "duration": str(datetime.now() - self.session_start)
+                "duration": str(self._session_duration())
             },
             "events_summary": self.generate_report(),
             "risk_summary": self.get_risk_summary(),
             "recent_events": self.get_recent_events(hours=24)
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(session_data, f, indent=2, default=str)
+        # Recent events hold the raw logged values; the default hook converts numpy/pandas leaves
+        with open(output_file, 'wb') as f:
+            f.write(_json_dumps(session_data, indent=True))
             
         self.logger.info(f"Session data exported to: {output_file}")
     
@@ -427,12 +663,11 @@ class EventLogger:
             return False
         
         # Load alert settings from YAML config
-        if self.config and hasattr(self.config, 'get_logging_config'):
-            log_cfg = self.config.get_logging_config()
+        if self.config and hasattr(self.config, 'logging'):
             if alert_type == 'profit_milestone':
-                return log_cfg.get('alert_on_profit_milestone', True)
+                return self.config.logging.alert_on_profit_milestone
             elif alert_type == 'risk_events':
-                return log_cfg.get('alert_on_risk_events', True)
+                return self.config.logging.alert_on_risk_events
         
         return False
     
@@ -6,9 +6,55 @@ Maintains state between runs using JSON files.
 
 import json
 import os
+import time
+import atexit
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 import shutil
+import hashlib
+import mmap
+from collections import defaultdict, deque
+from collections.abc import Mapping
+
+# Imported as src.persistence.grid_state_manager when src/ isn't on sys.path
+try:
+    from common.formatting import now_iso
+except ImportError:
+    from src.common.formatting import now_iso
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+
+class _LazyState(Mapping):
+    """Read-only mapping that runs each component's loader on first access and caches the result."""
+    
+    def __init__(self, loaders: Dict[str, Any]):
+        self._loaders = loaders
+        self._loaded: Dict[str, Any] = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._loaded:
+            self._loaded[key] = self._loaders[key]()
+        return self._loaded[key]
+    
+    def __iter__(self):
+        return iter(self._loaders)
+    
+    def __len__(self) -> int:
+        return len(self._loaders)
 
 
 class GridStateManager:
@@ -21,104 +67,242 @@ class GridStateManager:
     - Portfolio balances and statistics
     - Risk manager state
     - Trading history and metrics
+    
+    All components live in one state.json. Individual saves mark their component
+    dirty and the file is rewritten at most once per FLUSH_INTERVAL_SEC
+    (save_complete_state() and exit always write).
     """
     
-    def __init__(self, state_dir: str = "persistence", backup_count: int = 5):
+    FLUSH_INTERVAL_SEC = 5.0
+    # Saves are fsync'd, so a backup of every write isn't needed for durability
+    BACKUP_EVERY_N_SAVES = 5
+    # Backups of files at least this large are written zstd-compressed (.zst) when zstandard is installed
+    BACKUP_COMPRESS_MIN_BYTES = 64 * 1024
+    # Files at least this large are parsed straight from an mmap (orjson only)
+    MMAP_MIN_BYTES = 16 * 1024
+    
+    def __init__(self, state_dir: str = "persistence", backup_count: int = 5, verbose: bool = None):
         """
         Initialize the state manager.
         
         Args:
             state_dir: Directory to store state files
             backup_count: Number of backup files to keep
+            verbose: Print a line per save/load (default: GRID_STATE_VERBOSE env var)
         """
         self.state_dir = os.path.abspath(state_dir)
         self.backup_count = backup_count
+        # Save/load lines are off by default: each print is a write() on the per-tick save path
+        self.verbose = bool(os.environ.get('GRID_STATE_VERBOSE')) if verbose is None else verbose
         
-        # State file paths
+        # Combined state file
+        self.state_file = os.path.join(self.state_dir, "state.json")
+        
+        # Per-component files from older versions, read when state.json lacks the component
         self.grid_state_file = os.path.join(self.state_dir, "grid_state.json")
         self.portfolio_state_file = os.path.join(self.state_dir, "portfolio_state.json")
         self.trading_stats_file = os.path.join(self.state_dir, "trading_stats.json")
         self.risk_state_file = os.path.join(self.state_dir, "risk_state.json")
+        self._legacy_files = {
+            'grid': self.grid_state_file,
+            'portfolio': self.portfolio_state_file,
+            'stats': self.trading_stats_file,
+            'risk': self.risk_state_file
+        }
+        
+        # In-memory copy of state.json; components saved since the last write are dirty
+        self._state = None
+        self._dirty = set()
+        self._last_flush = 0.0
+        self._defer_flush = False
+        self._last_hash: Dict[str, int] = {}  # Content hash of the last write per file
+        self._save_counts: Dict[str, int] = defaultdict(int)
+        
+        # JSON-ready bought/sold levels, rebuilt only when the sets passed to save_grid_state() change
+        self._bought_set = set()
+        self._sold_set = set()
+        self._bought_list: List[int] = []
+        self._sold_list: List[list] = []
         
         # Ensure state directory exists
         os.makedirs(self.state_dir, exist_ok=True)
         
+        # Backups per state file, oldest first; trimmed in memory instead of listing the directory
+        self._backups = self._scan_backups()
+        self._zstd = zstd.ZstdCompressor(level=3) if zstd else None
+        atexit.register(self.flush, force=True)
+        
         print(f"✅ GridStateManager initialized - State directory: {self.state_dir}")
     
+    def _scan_backups(self) -> Dict[str, deque]:
+        """Existing backup paths per state file, oldest first (one directory scan at startup)."""
+        backups = defaultdict(deque)
+        try:
+            with os.scandir(self.state_dir) as entries:
+                found = [(entry.stat().st_mtime, entry.path) for entry in entries
+                         if '.backup_' in entry.name and entry.is_file()]
+        except OSError as e:
+            print(f"⚠️  Failed to scan backups: {e}")
+            return backups
+        
+        for _, path in sorted(found):
+            backups[path.split('.backup_')[0]].append(path)
+        return backups
+    
     def _create_backup(self, file_path: str) -> None:
         """Create a timestamped backup of the state file."""
-        if not os.path.exists(file_path):
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
             return
             
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         backup_path = f"{file_path}.backup_{timestamp}"
+        compress = self._zstd is not None and size >= self.BACKUP_COMPRESS_MIN_BYTES
+        backups = self._backups[file_path]
         
         try:
-            shutil.copy2(file_path, backup_path)
+            # A save earlier in the same second already used this name; replace it
+            if backups and backups[-1] in (backup_path, f"{backup_path}.zst"):
+                os.remove(backups.pop())
+            
+            if compress:
+                # Large JSON compresses several-fold; restore with any zstd tool
+                backup_path = f"{backup_path}.zst"
+                with open(file_path, 'rb') as src, open(backup_path, 'wb') as dst:
+                    self._zstd.copy_stream(src, dst)
+            else:
+                # State files are replaced by atomic rename, so the current inode is never modified
+                # again: a hard link is a complete snapshot without copying any bytes
+                try:
+                    os.link(file_path, backup_path)
+                except FileExistsError:
+                    os.remove(backup_path)
+                    os.link(file_path, backup_path)
+                except OSError:
+                    shutil.copy2(file_path, backup_path)  # Filesystems without hard links
+            backups.append(backup_path)
             
             # Clean up old backups
             self._cleanup_old_backups(file_path)
             
-        except Exception as e:
+        except OSError as e:
             print(f"⚠️  Failed to create backup for {file_path}: {e}")
     
     def _cleanup_old_backups(self, file_path: str) -> None:
         """Remove old backup files, keeping only the most recent ones."""
+        backups = self._backups[file_path]
         try:
-            dir_path = os.path.dirname(file_path)
-            base_name = os.path.basename(file_path)
-            
-            # Find all backup files for this state file
-            backup_files = []
-            for file in os.listdir(dir_path):
-                if file.startswith(f"{base_name}.backup_"):
-                    backup_files.append(os.path.join(dir_path, file))
-            
-            # Sort by modification time (newest first)
-            backup_files.sort(key=os.path.getmtime, reverse=True)
-            
-            # Remove old backups beyond the backup count
-            for old_backup in backup_files[self.backup_count:]:
-                os.remove(old_backup)
+            while len(backups) > self.backup_count:
+                old_backup = backups.popleft()
+                if os.path.exists(old_backup):
+                    os.remove(old_backup)
                 
-        except Exception as e:
+        except OSError as e:
             print(f"⚠️  Failed to cleanup old backups: {e}")
     
-    def _save_json_file(self, file_path: str, data: Dict[str, Any]) -> bool:
-        """Safely save data to JSON file with backup."""
+    def _save_json_file(self, file_path: str, data: Dict[str, Any], indent: Optional[int] = None) -> bool:
+        """
+        Safely save data to JSON file with backup.
+        State files are machine-read, so they're written compact unless indent is given.
+        """
         try:
-            # Create backup of existing file
-            self._create_backup(file_path)
+            # Unchanged content (ignoring save timestamps) needs no write, backup or rename
+            content_hash = self._content_hash(data)
+            if content_hash == self._last_hash.get(file_path) and os.path.exists(file_path):
+                return True
+            
+            # Create backup of existing file (every Nth save)
+            if self._save_counts[file_path] % self.BACKUP_EVERY_N_SAVES == 0:
+                self._create_backup(file_path)
+            self._save_counts[file_path] += 1
             
             # Add metadata
             data_with_metadata = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso(),
                 'version': '1.0',
                 'data': data
             }
             
             # Write to temporary file first, then rename (atomic operation)
+            # Serialize fully first so the file gets one write() instead of one per JSON token.
+            # The payload is a single exact-size bytes object handed to the fd through a memoryview,
+            # so there is no growing intermediate buffer to pre-size or reuse between saves
             temp_file = f"{file_path}.tmp"
-            with open(temp_file, 'w') as f:
-                json.dump(data_with_metadata, f, indent=2, default=str)
+            payload = self._dumps(data_with_metadata, indent)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             
-            # Atomic rename
-            os.rename(temp_file, file_path)
+            # Atomic rename, then sync the directory so the rename itself survives a crash
+            os.replace(temp_file, file_path)
+            self._fsync_dir(os.path.dirname(file_path) or '.')
+            self._last_hash[file_path] = content_hash
             
             return True
             
-        except Exception as e:
+        except (OSError, TypeError, ValueError) as e:
+            # I/O errors, or data the encoder can't serialize (orjson raises a TypeError subclass)
             print(f"❌ Failed to save {file_path}: {e}")
             return False
     
+    @staticmethod
+    def _fsync_dir(directory: str) -> None:
+        """fsync a directory entry (no-op where directories can't be opened, e.g. Windows)."""
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+    
+    def _content_hash(self, data: Dict[str, Any]) -> int:
+        """64-bit hash of data's JSON, leaving out per-component last_updated stamps."""
+        stable = {key: ({k: v for k, v in value.items() if k != 'last_updated'}
+                        if isinstance(value, dict) else value)
+                  for key, value in data.items()}
+        payload = self._dumps(stable)
+        if xxhash:
+            return xxhash.xxh64(payload).intdigest()
+        return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'little')
+    
+    @staticmethod
+    def _dumps(data: Any, indent: Optional[int] = None) -> bytes:
+        """Serialize to JSON bytes (orjson when available; it only supports 2-space indent)."""
+        if orjson:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=str, option=option)
+        if indent:
+            return json.dumps(data, indent=indent, default=str).encode()
+        return json.dumps(data, separators=(',', ':'), default=str).encode()
+    
     def _load_json_file(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Safely load data from JSON file."""
         if not os.path.exists(file_path):
             return None
             
         try:
-            with open(file_path, 'r') as f:
-                content = json.load(f)
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if orjson and size >= self.MMAP_MIN_BYTES:
+                    # Parse the mapped pages directly instead of copying them into a bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            content = orjson.loads(view)
+                else:
+                    raw = f.read()
+                    content = orjson.loads(raw) if orjson else json.loads(raw)
             
             # Handle both new format (with metadata) and old format (direct data)
             if isinstance(content, dict) and 'data' in content:
@@ -127,14 +311,60 @@ class GridStateManager:
                 # Old format - return as is
                 return content
                 
-        except Exception as e:
+        except (OSError, ValueError) as e:
+            # I/O errors and malformed JSON (JSONDecodeError is a ValueError)
             print(f"❌ Failed to load {file_path}: {e}")
             return None
     
+    def _read_state(self) -> Dict[str, Any]:
+        """Combined state (loaded from disk on first use)."""
+        if self._state is None:
+            state = self._load_json_file(self.state_file) or {}
+            for component, legacy_file in self._legacy_files.items():
+                if component not in state:
+                    legacy_data = self._load_json_file(legacy_file)
+                    if legacy_data is not None:
+                        state[component] = legacy_data
+            self._state = state
+        return self._state
+    
+    def _stage(self, component: str, data: Dict[str, Any]) -> bool:
+        """Store one component's data and mark it dirty; writes if the flush interval has passed."""
+        self._read_state()[component] = data
+        self._dirty.add(component)
+        if self._defer_flush:
+            return True
+        return self.flush()
+    
+    def flush(self, force: bool = False) -> bool:
+        """Write state.json if any component is dirty and the interval has passed (or force)."""
+        if not self._dirty:
+            return True
+        if not force and time.monotonic() - self._last_flush < self.FLUSH_INTERVAL_SEC:
+            return True
+        
+        success = self._save_json_file(self.state_file, self._state)
+        if success:
+            self._dirty.clear()
+            self._last_flush = time.monotonic()
+        return success
+    
+    def _component(self, component: str) -> Optional[Dict[str, Any]]:
+        """Copy of one component's saved data, or None."""
+        data = self._read_state().get(component)
+        return dict(data) if isinstance(data, dict) else None
+    
     # ========== GRID STATE PERSISTENCE ==========
     
+    def _reset_levels(self, bought_levels, sold_levels) -> None:
+        """Rebuild the tracked levels from full sets."""
+        self._bought_set = set(bought_levels)
+        self._sold_set = set(tuple(pair) for pair in sold_levels)
+        self._bought_list = list(self._bought_set)
+        self._sold_list = [list(pair) for pair in self._sold_set]
+    
     def save_grid_state(self, 
-                       grid_levels: List[Dict], 
+                       grid_levels: Union[List[Dict], 'GridLevels'], 
                        bought_levels: set, 
                        sold_levels: set,
                        current_regime: str = None,
@@ -144,35 +374,44 @@ class GridStateManager:
         Save current grid state to persistent storage.
         
         Args:
-            grid_levels: List of grid level dictionaries
+            grid_levels: List of grid level dictionaries, or a GridLevels (saved as columns)
             bought_levels: Set of bought level indices
             sold_levels: Set of sold level tuples (level, price)
             current_regime: Current market regime
             grid_center_price: Center price of the grid
             **kwargs: Additional state data
         """
+        # Callers passing full sets only cost a rebuild when they differ from what we track
+        if bought_levels != self._bought_set:
+            self._reset_levels(bought_levels, self._sold_set)
+        if sold_levels != self._sold_set:
+            self._reset_levels(self._bought_set, sold_levels)
+        
         state_data = {
-            'grid_levels': grid_levels,
-            'bought_levels': list(bought_levels),
-            'sold_levels': [list(pair) for pair in sold_levels],
+            'grid_levels': grid_levels if isinstance(grid_levels, list) else grid_levels.to_json(),
+            'bought_levels': self._bought_list,
+            'sold_levels': self._sold_list,
             'current_regime': current_regime,
             'grid_center_price': grid_center_price,
             'grid_generated': True,
-            'last_updated': datetime.now().isoformat(),
+            'last_updated': now_iso(),
             **kwargs
         }
         
-        success = self._save_json_file(self.grid_state_file, state_data)
+        success = self._stage('grid', state_data)
         if success:
-            print(f"💾 Grid state saved - {len(grid_levels)} levels, {len(bought_levels)} bought")
+            if self.verbose:
+                print(f"💾 Grid state saved - {len(grid_levels)} levels, {len(self._bought_list)} bought")
         
         return success
     
     def load_grid_state(self) -> Optional[Dict[str, Any]]:
         """Load grid state from persistent storage."""
-        state_data = self._load_json_file(self.grid_state_file)
+        state_data = self._component('grid')
         
         if state_data:
+            self._reset_levels(state_data.get('bought_levels', []), state_data.get('sold_levels', []))
+            
             # Convert sold_levels back to set of tuples
             if 'sold_levels' in state_data:
                 state_data['sold_levels'] = set(tuple(pair) for pair in state_data['sold_levels'])
@@ -181,10 +420,18 @@ class GridStateManager:
             if 'bought_levels' in state_data:
                 state_data['bought_levels'] = set(state_data['bought_levels'])
             
-            print(f"📂 Grid state loaded - {len(state_data.get('grid_levels', []))} levels")
+            # Columnar grid levels are handed back as level dicts, which is what callers restore;
+            # only the strategy saves those, so the strategy package is importable whenever one is found
+            if isinstance(state_data.get('grid_levels'), dict):
+                from strategy.grid_generator import GridLevels
+                state_data['grid_levels'] = GridLevels.from_json(state_data['grid_levels']).as_dicts()
+            
+            if self.verbose:
+                print(f"📂 Grid state loaded - {len(state_data.get('grid_levels', []))} levels")
             return state_data
         
-        print("📂 No existing grid state found")
+        if self.verbose:
+            print("📂 No existing grid state found")
         return None
     
     # ========== PORTFOLIO STATE PERSISTENCE ==========
@@ -201,25 +448,28 @@ class GridStateManager:
             'btc_balance': btc_balance,
             'total_capital': total_capital,
             'capital_per_grid': capital_per_grid,
-            'last_updated': datetime.now().isoformat(),
+            'last_updated': now_iso(),
             **kwargs
         }
         
-        success = self._save_json_file(self.portfolio_state_file, portfolio_data)
+        success = self._stage('portfolio', portfolio_data)
         if success:
-            print(f"💾 Portfolio state saved - USDT: ${usdt_balance:,.2f}, BTC: {btc_balance:.6f}")
+            if self.verbose:
+                print(f"💾 Portfolio state saved - USDT: ${usdt_balance:,.2f}, BTC: {btc_balance:.6f}")
         
         return success
     
     def load_portfolio_state(self) -> Optional[Dict[str, Any]]:
         """Load portfolio state from persistent storage."""
-        portfolio_data = self._load_json_file(self.portfolio_state_file)
+        portfolio_data = self._component('portfolio')
         
         if portfolio_data:
-            print(f"📂 Portfolio state loaded - Capital: ${portfolio_data.get('total_capital', 0):,.2f}")
+            if self.verbose:
+                print(f"📂 Portfolio state loaded - Capital: ${portfolio_data.get('total_capital', 0):,.2f}")
             return portfolio_data
         
-        print("📂 No existing portfolio state found")
+        if self.verbose:
+            print("📂 No existing portfolio state found")
         return None
     
     # ========== TRADING STATISTICS PERSISTENCE ==========
@@ -240,25 +490,28 @@ class GridStateManager:
             'winning_trades': winning_trades,
             'losing_trades': losing_trades,
             'completed_cycles': completed_cycles,
-            'last_updated': datetime.now().isoformat(),
+            'last_updated': now_iso(),
             **kwargs
         }
         
-        success = self._save_json_file(self.trading_stats_file, stats_data)
+        success = self._stage('stats', stats_data)
         if success:
-            print(f"💾 Trading stats saved - {total_trades} trades, ${total_pnl:.2f} P&L")
+            if self.verbose:
+                print(f"💾 Trading stats saved - {total_trades} trades, ${total_pnl:.2f} P&L")
         
         return success
     
     def load_trading_stats(self) -> Optional[Dict[str, Any]]:
         """Load trading statistics from persistent storage."""
-        stats_data = self._load_json_file(self.trading_stats_file)
+        stats_data = self._component('stats')
         
         if stats_data:
-            print(f"📂 Trading stats loaded - {stats_data.get('total_trades', 0)} trades")
+            if self.verbose:
+                print(f"📂 Trading stats loaded - {stats_data.get('total_trades', 0)} trades")
             return stats_data
         
-        print("📂 No existing trading stats found")
+        if self.verbose:
+            print("📂 No existing trading stats found")
         return None
     
     # ========== RISK STATE PERSISTENCE ==========
@@ -275,25 +528,28 @@ class GridStateManager:
             'max_drawdown': max_drawdown,
             'daily_loss': daily_loss,
             'consecutive_losses': consecutive_losses,
-            'last_updated': datetime.now().isoformat(),
+            'last_updated': now_iso(),
             **kwargs
         }
         
-        success = self._save_json_file(self.risk_state_file, risk_data)
+        success = self._stage('risk', risk_data)
         if success:
-            print(f"💾 Risk state saved - Drawdown: ${current_drawdown:.2f}")
+            if self.verbose:
+                print(f"💾 Risk state saved - Drawdown: ${current_drawdown:.2f}")
         
         return success
     
     def load_risk_state(self) -> Optional[Dict[str, Any]]:
         """Load risk manager state from persistent storage."""
-        risk_data = self._load_json_file(self.risk_state_file)
+        risk_data = self._component('risk')
         
         if risk_data:
-            print(f"📂 Risk state loaded - Max drawdown: ${risk_data.get('max_drawdown', 0):.2f}")
+            if self.verbose:
+                print(f"📂 Risk state loaded - Max drawdown: ${risk_data.get('max_drawdown', 0):.2f}")
             return risk_data
         
-        print("📂 No existing risk state found")
+        if self.verbose:
+            print("📂 No existing risk state found")
         return None
     
     # ========== COMPREHENSIVE STATE OPERATIONS ==========
@@ -305,13 +561,15 @@ class GridStateManager:
         Args:
             strategy_controller: GridStrategyController instance
         """
+        # Stage all four components, then write state.json once
+        self._defer_flush = True
         try:
             # 1. Save grid state
-            execution_status = strategy_controller.order_executor.get_execution_status()
+            order_executor = strategy_controller.order_executor
             grid_success = self.save_grid_state(
                 grid_levels=strategy_controller.grid_levels,
-                bought_levels=execution_status['bought_levels'],
-                sold_levels=execution_status['sold_levels'],
+                bought_levels=order_executor.bought_levels,
+                sold_levels=order_executor.sold_levels,
                 current_regime=strategy_controller.current_regime,
                 grid_center_price=getattr(strategy_controller, 'grid_center_price', None)
             )
@@ -319,11 +577,12 @@ class GridStateManager:
             # 2. Save portfolio state
             try:
                 account_info = strategy_controller.client.get_account()
-                usdt_balance = float([asset['free'] for asset in account_info['balances'] 
-                                    if asset['asset'] == 'USDT'][0])
-                btc_balance = float([asset['free'] for asset in account_info['balances'] 
-                                   if asset['asset'] == 'BTC'][0])
-            except:
+                balances = {asset['asset']: asset['free'] for asset in account_info['balances']}
+                usdt_balance = float(balances.get('USDT', 0.0))
+                btc_balance = float(balances.get('BTC', 0.0))
+            except (OSError, KeyError, ValueError) as e:
+                # Network errors (requests' exceptions are OSErrors) and malformed balance payloads
+                print(f"⚠️  Could not read account balances: {e}")
                 usdt_balance = 0.0
                 btc_balance = 0.0
             
@@ -354,75 +613,86 @@ class GridStateManager:
                 consecutive_losses=risk_status.get('consecutive_losses', 0)
             )
             
-            overall_success = grid_success and portfolio_success and stats_success and risk_success
+            self._defer_flush = False
+            flush_success = self.flush(force=True)
             
-            if overall_success:
-                print("✅ Complete strategy state saved successfully")
-            else:
+            overall_success = grid_success and portfolio_success and stats_success and risk_success and flush_success
+            
+            if not overall_success:
                 print("⚠️  Some state components failed to save")
+            elif self.verbose:
+                print("✅ Complete strategy state saved successfully")
             
             return overall_success
             
-        except Exception as e:
+        except (OSError, ValueError) as e:
             print(f"❌ Failed to save complete state: {e}")
             return False
+        
+        finally:
+            self._defer_flush = False
     
-    def load_complete_state(self) -> Dict[str, Optional[Dict[str, Any]]]:
+    def load_complete_state(self) -> Mapping:
         """
         Load complete strategy state.
         
         Returns:
-            Dictionary containing all loaded state components
+            Mapping of all state components; each is loaded on first access
         """
-        return {
-            'grid_state': self.load_grid_state(),
-            'portfolio_state': self.load_portfolio_state(),
-            'trading_stats': self.load_trading_stats(),
-            'risk_state': self.load_risk_state()
-        }
+        return _LazyState({
+            'grid_state': self.load_grid_state,
+            'portfolio_state': self.load_portfolio_state,
+            'trading_stats': self.load_trading_stats,
+            'risk_state': self.load_risk_state
+        })
     
     def clear_all_state(self) -> bool:
         """Clear all persistent state (for reset/testing purposes)."""
         try:
-            state_files = [
-                self.grid_state_file,
-                self.portfolio_state_file, 
-                self.trading_stats_file,
-                self.risk_state_file
-            ]
+            state_files = [self.state_file, *self._legacy_files.values()]
             
             for file_path in state_files:
                 if os.path.exists(file_path):
                     os.remove(file_path)
             
+            self._state = {}
+            self._dirty.clear()
+            self._last_hash.clear()
+            self._reset_levels((), ())
+            
             print("🗑️  All persistent state cleared")
             return True
             
-        except Exception as e:
+        except OSError as e:
             print(f"❌ Failed to clear state: {e}")
             return False
     
     def get_state_summary(self) -> Dict[str, Any]:
         """Get a summary of current persistent state."""
-        state_files = [
-            ('Grid State', self.grid_state_file),
-            ('Portfolio State', self.portfolio_state_file),
-            ('Trading Stats', self.trading_stats_file),
-            ('Risk State', self.risk_state_file)
+        components = [
+            ('Grid State', 'grid'),
+            ('Portfolio State', 'portfolio'),
+            ('Trading Stats', 'stats'),
+            ('Risk State', 'risk')
         ]
         
+        state = self._read_state()
+        try:
+            stat_info = os.stat(self.state_file)
+            size = stat_info.st_size
+            modified = datetime.fromtimestamp(stat_info.st_mtime).isoformat()
+        except OSError:
+            size, modified = 0, 'unknown'
+        
         summary = {}
-        for name, file_path in state_files:
-            if os.path.exists(file_path):
-                try:
-                    stat_info = os.stat(file_path)
-                    summary[name] = {
-                        'exists': True,
-                        'size': stat_info.st_size,
-                        'modified': datetime.fromtimestamp(stat_info.st_mtime).isoformat()
-                    }
-                except:
-                    summary[name] = {'exists': True, 'size': 0, 'modified': 'unknown'}
+        for name, component in components:
+            if component in state:
+                summary[name] = {
+                    'exists': True,
+                    'size': size,
+                    'modified': modified,
+                    'pending_write': component in self._dirty
+                }
             else:
                 summary[name] = {'exists': False}
         
@@ -1,16 +1,112 @@
+import atexit
+import time
+import weakref
+from collections import namedtuple
 from datetime import datetime
 
+import numpy as np
+
+# Immutable position record for history lists (opened and closed positions)
+Position = namedtuple("Position", "buy_price quantity timestamp sell_price", defaults=(None,))
+
+# Live managers whose buffered trades are flushed at exit; weak so the hook doesn't keep them alive
+_live_managers = weakref.WeakSet()
+
+
+def _flush_live_managers():
+    """atexit hook: hand every live manager's buffered trades to its EventLogger."""
+    for manager in list(_live_managers):
+        manager.flush_trades(force=True)
+
+
 class PositionManager:
     """
     Manages positions, P&L, and trade tracking.
     Logs all trades using EventLogger.
     """
 
+    # Trade log entries are handed to the EventLogger in batches
+    TRADE_BATCH_SIZE = 64
+    TRADE_FLUSH_INTERVAL_SEC = 1.0
+
+    __slots__ = (
+        "logger", "positions", "current_position", "_trade_buffer", "_last_trade_flush",
+        "_closed_buy", "_closed_sell", "_closed_qty", "_closed_timestamps",
+        "_closed_count", "_closed_cache", "_realized_pnl_total",
+        "_open_sold_qty", "_open_sold_value", "__weakref__"
+    )
+
     def __init__(self, event_logger):
         self.logger = event_logger
-        self.positions = []  # Each item: {'buy_price', 'quantity', 'timestamp'}
-        self.closed_positions = []  # Track closed for history
+        self.positions = []  # Each item: Position(buy_price, quantity, timestamp)
         self.current_position = None
+        self._reset_closed()
+        self._trade_buffer = []
+        self._last_trade_flush = time.monotonic()
+        _live_managers.add(self)
+        # atexit runs hooks last-in first-out; moving the single hook after this manager's
+        # EventLogger (which registers its own close()) makes the flush happen before the close
+        atexit.unregister(_flush_live_managers)
+        atexit.register(_flush_live_managers)
+
+    def _log_trade(self, trade):
+        """Buffer one trade log entry, flushing when the batch is full or the interval has passed."""
+        self._trade_buffer.append(trade)
+        self.flush_trades()
+
+    def flush_trades(self, force=False):
+        """Send buffered trade entries to the EventLogger in one call."""
+        if not self._trade_buffer:
+            return
+        if (not force and len(self._trade_buffer) < self.TRADE_BATCH_SIZE
+                and time.monotonic() - self._last_trade_flush < self.TRADE_FLUSH_INTERVAL_SEC):
+            return
+        trades, self._trade_buffer = self._trade_buffer, []
+        self._last_trade_flush = time.monotonic()
+        self.logger.log_trades_batch(trades)
+
+    def _reset_closed(self):
+        """Empty the closed-position history and the open position's sell totals."""
+        # Closed positions as parallel arrays (grown by doubling); dicts are built on demand
+        self._closed_buy = np.empty(0, np.float64)
+        self._closed_sell = np.empty(0, np.float64)
+        self._closed_qty = np.empty(0, np.float64)
+        self._closed_timestamps = []
+        self._closed_count = 0
+        self._closed_cache = []
+        self._realized_pnl_total = 0.0  # Running sum over closed positions
+        # Sells against the open position, for its average exit price
+        self._open_sold_qty = 0.0
+        self._open_sold_value = 0.0
+
+    def _record_close(self, buy_price, sell_price, quantity, timestamp):
+        """Append one closed position to the history arrays."""
+        n = self._closed_count
+        if n == len(self._closed_buy):
+            capacity = max(16, 2 * n)
+            for name in ("_closed_buy", "_closed_sell", "_closed_qty"):
+                grown = np.empty(capacity, np.float64)
+                grown[:n] = getattr(self, name)[:n]
+                setattr(self, name, grown)
+        self._closed_buy[n] = buy_price
+        self._closed_sell[n] = sell_price
+        self._closed_qty[n] = quantity
+        self._closed_timestamps.append(timestamp)
+        self._closed_count = n + 1
+        self._realized_pnl_total += (sell_price - buy_price) * quantity
+
+    @property
+    def closed_positions(self):
+        """Closed positions as Position tuples; sell_price is the average exit price."""
+        cache = self._closed_cache
+        for i in range(len(cache), self._closed_count):
+            cache.append(Position(
+                float(self._closed_buy[i]),
+                float(self._closed_qty[i]),
+                self._closed_timestamps[i],
+                float(self._closed_sell[i])
+            ))
+        return cache
 
     def track_position(self, buy_price, quantity, timestamp=None):
         """Open a new position (buy). Use buy() method instead for consistency."""
@@ -29,10 +125,7 @@ class PositionManager:
 
     def calculate_pnl(self, current_price=None):
         """Calculate realized and unrealized P&L."""
-        realized = 0
-        for pos in self.closed_positions:
-            pnl = (pos.get("sell_price", pos["buy_price"]) - pos["buy_price"]) * pos["quantity"]
-            realized += pnl
+        realized = self._realized_pnl_total
         unrealized = 0
         if self.current_position and current_price is not None:
             unrealized = (current_price - self.current_position["buy_price"]) * self.current_position["quantity"]
@@ -62,10 +155,10 @@ class PositionManager:
                 "quantity": quantity,
                 "timestamp": timestamp
             }
-            self.positions.append(self.current_position.copy())
+            self.positions.append(Position(price, quantity, timestamp))
         
         # Log the trade
-        self.logger.log_trade({
+        self._log_trade({
             "symbol": "",
             "side": "buy",
             "qty": quantity,
@@ -84,7 +177,7 @@ class PositionManager:
         pnl = (price - self.current_position["buy_price"]) * quantity
         
         # Log the trade
-        self.logger.log_trade({
+        self._log_trade({
             "symbol": "",
             "side": "sell",
             "qty": quantity,
@@ -94,13 +187,22 @@ class PositionManager:
         })
         
         self.current_position["quantity"] -= quantity
+        self._open_sold_qty += quantity
+        self._open_sold_value += price * quantity
         if self.current_position["quantity"] == 0:
             # Move to closed positions
-            self.closed_positions.append(self.current_position.copy())
+            self._record_close(
+                self.current_position["buy_price"],
+                self._open_sold_value / self._open_sold_qty,
+                self._open_sold_qty,
+                self.current_position["timestamp"]
+            )
+            self._open_sold_qty = 0.0
+            self._open_sold_value = 0.0
             self.current_position = None
 
     def reset_position(self):
         """Reset all position tracking (danger: clears history)."""
         self.positions = []
-        self.closed_positions = []
         self.current_position = None
+        self._reset_closed()
@@ -2,6 +2,46 @@
 Grid display and monitoring utilities.
 Extracted from GridStrategyController for better organization.
 """
+import numpy as np
+
+from strategy.grid_generator import BUY, SELL, SIDE_NAMES, GridLevels
+
+# Status column by code: 0 = wait, 1 = ready sell, 2 = ready buy (see _status_codes)
+_STATUS_NAMES = ("⏳ WAIT", "🔴 READY", "🟢 READY")
+
+
+def _as_grid_levels(grid_levels):
+    """Accept either a GridLevels or a list of level dicts."""
+    if isinstance(grid_levels, GridLevels):
+        return grid_levels
+    return GridLevels.from_dicts(grid_levels)
+
+
+def _executed_masks(grid, bought_levels, sold_levels):
+    """
+    Per-level (bought, sold) masks. Level numbers are matched with one vectorized isin;
+    sold levels are keyed by (level, price), so only rows whose level number matched
+    get the exact pair check.
+    """
+    if bought_levels:
+        bought = np.isin(grid.levels, np.fromiter(bought_levels, np.int64, len(bought_levels)))
+    else:
+        bought = np.zeros(len(grid), bool)
+    
+    if sold_levels:
+        sold = np.isin(grid.levels, np.fromiter((level for level, _ in sold_levels), np.int64, len(sold_levels)))
+        for i in np.flatnonzero(sold).tolist():
+            if (int(grid.levels[i]), float(grid.prices[i])) not in sold_levels:
+                sold[i] = False
+    else:
+        sold = np.zeros(len(grid), bool)
+    
+    return bought, sold
+
+
+def _status_codes(grid, current_price):
+    """Per-level index into _STATUS_NAMES, from one vectorized ready check."""
+    return grid.ready_mask(current_price) * (1 + (grid.sides == BUY))
 
 
 class GridDisplay:
@@ -23,25 +63,25 @@ class GridDisplay:
         print(f"{'Level':<6} | {'Side':<4} | {'Price':<12} | {'Status'}")
         print("-" * 70)
         
-        for level in sorted(grid_levels, key=lambda x: x['level']):
-            price = level['price']
-            
-            # Determine status based on current price
-            if level['side'] == 'BUY':
-                status = "🟢 READY" if current_price <= price else "⏳ WAIT"
-            else:
-                status = "🔴 READY" if current_price >= price else "⏳ WAIT"
-            
-            print(f"{level['level']:>5} | {level['side']:<4} | ${price:>10,.2f} | {status}")
+        grid = _as_grid_levels(grid_levels)
+        is_buy = grid.sides == BUY
+        ready = grid.ready_mask(current_price)
+        status_code = ready * (1 + is_buy)  # Same codes as _status_codes(), reusing the masks
+        
+        # Sort once, then walk plain Python values (no per-row NumPy scalar indexing)
+        order = np.argsort(grid.levels, kind='stable')
+        for level, side, price, code in zip(grid.levels[order].tolist(), grid.sides[order].tolist(),
+                                            grid.prices[order].tolist(), status_code[order].tolist()):
+            print(f"{level:>5} | {SIDE_NAMES[side]:<4} | ${price:>10,.2f} | {_STATUS_NAMES[code]}")
         
         # Summary
-        buy_levels = [l for l in grid_levels if l['side'] == 'BUY']
-        sell_levels = [l for l in grid_levels if l['side'] == 'SELL']
-        ready_buys = len([l for l in buy_levels if current_price <= l['price']])
-        ready_sells = len([l for l in sell_levels if current_price >= l['price']])
+        buy_count = int(is_buy.sum())
+        sell_count = len(grid) - buy_count
+        ready_buys = int((ready & is_buy).sum())
+        ready_sells = int(ready.sum()) - ready_buys
         
         print("-" * 70)
-        print(f"📊 Total: {len(grid_levels)} levels | Buy: {len(buy_levels)} | Sell: {len(sell_levels)}")
+        print(f"📊 Total: {len(grid)} levels | Buy: {buy_count} | Sell: {sell_count}")
         print(f"🟢 Ready: {ready_buys + ready_sells} levels | Buy: {ready_buys} | Sell: {ready_sells}")
         print("=" * 70)
 
@@ -53,22 +93,18 @@ class GridDisplay:
         print("-" * 50)
         
         # Show remaining ready levels
-        buy_ready = []
-        sell_ready = []
+        grid = _as_grid_levels(grid_levels)
+        ready = grid.ready_mask(current_price)
         
-        for level in grid_levels:
-            if level['side'] == 'BUY' and current_price <= level['price'] and level['level'] not in bought_levels:
-                buy_ready.append(level)
-            elif level['side'] == 'SELL' and current_price >= level['price'] and (level['level'], level['price']) not in sold_levels:
-                sell_ready.append(level)
+        bought, sold = _executed_masks(grid, bought_levels, sold_levels)
+        buy_idx = np.flatnonzero(ready & (grid.sides == BUY) & ~bought)
+        sell_idx = np.flatnonzero(ready & (grid.sides == SELL) & ~sold)
         
-        print(f"🟢 Ready BUY levels: {len(buy_ready)}")
-        for level in sorted(buy_ready, key=lambda x: x['level'])[:3]:  # Show top 3
-            print(f"   L{level['level']}: ${level['price']:,.2f}")
-        
-        print(f"🔴 Ready SELL levels: {len(sell_ready)}")
-        for level in sorted(sell_ready, key=lambda x: x['level'])[:3]:  # Show top 3
-            print(f"   L{level['level']}: ${level['price']:,.2f}")
+        for label, idx in (("🟢 Ready BUY levels", buy_idx), ("🔴 Ready SELL levels", sell_idx)):
+            print(f"{label}: {len(idx)}")
+            top = idx[np.argsort(grid.levels[idx], kind='stable')][:3]  # Show top 3
+            for level, price in zip(grid.levels[top].tolist(), grid.prices[top].tolist()):
+                print(f"   L{level}: ${price:,.2f}")
         
         position_qty = current_position.get('quantity', 0) if current_position else 0
         print(f"💰 Current Position: {position_qty:.6f} BTC")
@@ -83,33 +119,26 @@ class GridDisplay:
         
         print("   📋 Current Grid Levels:")
         
+        grid = _as_grid_levels(grid_levels)
+        inv_cp_100 = 100.0 / current_price
+        distance = grid.prices - current_price
+        distance_pct = distance * inv_cp_100
+        
         # Find levels close to current price (within 2% up and down)
-        close_levels = []
-        for level in grid_levels:
-            distance_pct = abs(level['price'] - current_price) / current_price * 100
-            if distance_pct <= 2.0:  # Show levels within 2%
-                close_levels.append(level)
+        close_idx = np.flatnonzero(np.abs(distance_pct) <= 2.0)
         
         # If no close levels, show 4 nearest on each side
-        if not close_levels:
-            sorted_levels = sorted(grid_levels, key=lambda x: abs(x['price'] - current_price))
-            close_levels = sorted_levels[:4]  # Show 4 nearest levels
+        if len(close_idx) == 0:
+            close_idx = np.argsort(np.abs(distance), kind='stable')[:4]  # Show 4 nearest levels
         
         # Sort by level number
-        close_levels.sort(key=lambda x: x['level'])
+        close_idx = close_idx[np.argsort(grid.levels[close_idx], kind='stable')]
+        status_code = _status_codes(grid, current_price)
         
-        for level in close_levels:
-            price = level['price']
-            distance = price - current_price
-            distance_pct = distance / current_price * 100
-            
-            # Status
-            if level['side'] == 'BUY':
-                status = "🟢 READY" if current_price <= price else "⏳ WAIT"
-            else:
-                status = "🔴 READY" if current_price >= price else "⏳ WAIT"
-            
-            print(f"      L{level['level']:2d} | {level['side']:<4} | ${price:8,.2f} | {distance_pct:+5.2f}% | {status}")
+        for level, side, price, pct, code in zip(grid.levels[close_idx].tolist(), grid.sides[close_idx].tolist(),
+                                                 grid.prices[close_idx].tolist(), distance_pct[close_idx].tolist(),
+                                                 status_code[close_idx].tolist()):
+            print(f"      L{level:2d} | {SIDE_NAMES[side]:<4} | ${price:8,.2f} | {pct:+5.2f}% | {_STATUS_NAMES[code]}")
     
     def print_portfolio_status(self, client, total_capital, cycle_tracker):
         """Print portfolio and performance status."""
@@ -118,10 +147,10 @@ class GridDisplay:
         # Show account balance
         try:
             account_info = client.get_account()
-            usdt_balance = float([asset['free'] for asset in account_info['balances'] 
-                               if asset['asset'] == 'USDT'][0])
-            btc_balance = float([asset['free'] for asset in account_info['balances'] 
-                               if asset['asset'] == 'BTC'][0])
+            wanted = {'USDT', 'BTC'}
+            found = {asset['asset']: asset['free'] for asset in account_info['balances'] if asset['asset'] in wanted}
+            usdt_balance = float(found.get('USDT', 0))
+            btc_balance = float(found.get('BTC', 0))
             print(f"   💵 USDT Balance: ${usdt_balance:,.2f}")
             print(f"   ₿  BTC Balance: {btc_balance:.6f} BTC")
         except Exception as e:
@@ -145,8 +174,11 @@ class GridDisplay:
         """Print active orders status."""
         print("📋 Active Orders:")
         if grid_levels:
-            active_buys = len([l for l in grid_levels if l['side'] == 'BUY' and l['level'] not in bought_levels])
-            active_sells = len([l for l in grid_levels if l['side'] == 'SELL' and (l['level'], l['price']) not in sold_levels])
+            grid = _as_grid_levels(grid_levels)
+            is_buy = grid.sides == BUY
+            bought, sold = _executed_masks(grid, bought_levels, sold_levels)
+            active_buys = int((is_buy & ~bought).sum())
+            active_sells = int((~is_buy & ~sold).sum())
             print(f"   📊 Active BUY Orders: {active_buys}")
             print(f"   📊 Active SELL Orders: {active_sells}")
         else:
@@ -284,9 +316,9 @@ class GridDisplay:
             
         print(f"📋 Recent Trades (Last {min(len(recent_trades), limit)}):")
         for trade in recent_trades[-limit:]:
-            pnl_str = f"${trade['pnl']:.2f}" if trade['pnl'] != 0 else "--"
-            trade_type_icon = "🛑" if trade['trade_type'] == 'STOP_LOSS' else "🔄"
-            print(f"   {trade_type_icon} {trade['side']} L{trade['grid_level']} @ ${trade['price']:.2f} | P&L: {pnl_str}")
+            pnl_str = f"${trade.pnl:.2f}" if trade.pnl != 0 else "--"
+            trade_type_icon = "🛑" if trade.trade_type == 'STOP_LOSS' else "🔄"
+            print(f"   {trade_type_icon} {trade.side} L{trade.grid_level} @ ${trade.price:.2f} | P&L: {pnl_str}")
     
     def print_volume_status(self, volume_filter, symbol='BTCUSDT'):
         """Print volume filter status from YAML config."""
@@ -2,8 +2,67 @@
 Grid generation and management utilities.
 Extracted from GridStrategyController for better organization.
 """
+from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
+# Side and status codes used by GridLevels
+BUY, SELL = 0, 1
+SIDE_NAMES = ('BUY', 'SELL')
+STATUS_NAMES = ('pending', 'filled')
+
+
+@dataclass(slots=True)
+class GridLevels:
+    """Grid levels as parallel arrays (sorted by price) instead of one dict per level."""
+    prices: np.ndarray   # float64
+    sides: np.ndarray    # int8, BUY / SELL
+    levels: np.ndarray   # int32 level numbers (negative below the center)
+    status: np.ndarray   # uint8 index into STATUS_NAMES
+    
+    def __len__(self):
+        return len(self.prices)
+    
+    @classmethod
+    def from_dicts(cls, grid_levels):
+        """Build from a list of level dicts (e.g. restored state)."""
+        n = len(grid_levels)
+        return cls(
+            prices=np.fromiter((l['price'] for l in grid_levels), np.float64, n),
+            sides=np.fromiter((SELL if l['side'] == 'SELL' else BUY for l in grid_levels), np.int8, n),
+            levels=np.fromiter((l['level'] for l in grid_levels), np.int32, n),
+            status=np.fromiter((l.get('status') == 'filled' for l in grid_levels), np.uint8, n)
+        )
+    
+    def as_dicts(self):
+        """Level dicts ({'price', 'side', 'level', 'status'}) for code that works per level."""
+        return [
+            {'price': price, 'side': SIDE_NAMES[side], 'level': level, 'status': STATUS_NAMES[status]}
+            for price, side, level, status in zip(
+                self.prices.tolist(), self.sides.tolist(), self.levels.tolist(), self.status.tolist())
+        ]
+    
+    def to_json(self):
+        """JSON-ready columns, as saved by GridStateManager.save_grid_state()."""
+        return {'price': self.prices.tolist(), 'side': self.sides.tolist(),
+                'level': self.levels.tolist(), 'status': self.status.tolist()}
+    
+    @classmethod
+    def from_json(cls, data):
+        """Rebuild from the columns written by to_json()."""
+        return cls(
+            prices=np.asarray(data['price'], dtype=np.float64),
+            sides=np.asarray(data['side'], dtype=np.int8),
+            levels=np.asarray(data['level'], dtype=np.int32),
+            status=np.asarray(data['status'], dtype=np.uint8)
+        )
+    
+    def ready_mask(self, current_price):
+        """Levels the current price has reached: buys at or above it, sells at or below it."""
+        return (((self.sides == BUY) & (current_price <= self.prices)) |
+                ((self.sides == SELL) & (current_price >= self.prices)))
+
 
 class GridGenerator:
     """Handles grid level generation and management."""
@@ -16,42 +75,35 @@ class GridGenerator:
         """
         Generate grid levels for dashboard display.
         """
-        grid_cfg = self.cfg.get_grid_config()
-        base_spacing_pct = grid_cfg.get('grid_spacing_pct', 0.5) / 100
-        levels = grid_cfg.get('levels', 10)
+        return self.generate_grid_arrays(current_price, volatility_adjusted_spacing).as_dicts()
+    
+    def generate_grid_arrays(self, current_price, volatility_adjusted_spacing=None):
+        """
+        Generate grid levels as a GridLevels (parallel arrays, sorted by price).
+        """
+        grid_cfg = self.cfg.grid
+        base_spacing_pct = grid_cfg.grid_spacing_pct / 100
+        levels = grid_cfg.levels
         
         # Use volatility adjusted spacing if provided
         spacing_pct = volatility_adjusted_spacing or base_spacing_pct
         
-        grid_levels = []
-        
-        # Generate buy levels (below current price)
-        for i in range(1, (levels // 2) + 1):
-            buy_price = current_price * (1 - (spacing_pct * i))
-            grid_levels.append({
-                'price': buy_price,
-                'side': 'BUY',
-                'level': -i,
-                'status': 'pending'
-            })
-        
-        # Generate sell levels (above current price)
-        for i in range(1, (levels // 2) + 1):
-            sell_price = current_price * (1 + (spacing_pct * i))
-            grid_levels.append({
-                'price': sell_price,
-                'side': 'SELL', 
-                'level': i,
-                'status': 'pending'
-            })
-        
-        # Sort by price (lowest to highest)
-        grid_levels.sort(key=lambda x: x['price'])
+        # Buy levels below current price (farthest first), then sell levels above: with a positive
+        # spacing the concatenation is already sorted by price (lowest to highest), so no sort pass
+        k = levels // 2
+        idx = np.arange(1, k + 1)
+        rev = idx[::-1]
+        grid_levels = GridLevels(
+            prices=np.concatenate((current_price * (1 - spacing_pct * rev), current_price * (1 + spacing_pct * idx))),
+            sides=np.repeat(np.array([BUY, SELL], np.int8), k),
+            levels=np.concatenate((-rev, idx)).astype(np.int32),
+            status=np.zeros(2 * k, np.uint8)
+        )
         
         self.logger.log_signal("grid_generated", {
             "center_price": current_price,
             "total_levels": len(grid_levels),
-            "price_range": f"{grid_levels[0]['price']:.2f} - {grid_levels[-1]['price']:.2f}",
+            "price_range": f"{grid_levels.prices[0]:.2f} - {grid_levels.prices[-1]:.2f}",
             "spacing_pct": spacing_pct * 100
         })
         
@@ -62,13 +114,13 @@ class GridGenerator:
         Define base grid parameters based on current market price with volatility adjustments.
         """
         current_price = df_ind['close'].iloc[-1]
-        grid_cfg = self.cfg.get_grid_config()
+        grid_cfg = self.cfg.grid
         
         # Base parameters from config
-        base_grid_range_pct = grid_cfg.get('grid_range_pct', 2.5) / 100
-        base_grid_spacing_pct = grid_cfg.get('grid_spacing_pct', 0.5) / 100
-        levels = grid_cfg.get('levels', 10)
-        base_capital_per_grid = grid_cfg.get('capital_per_grid_pct', 10.0)
+        base_grid_range_pct = grid_cfg.grid_range_pct / 100
+        base_grid_spacing_pct = grid_cfg.grid_spacing_pct / 100
+        levels = grid_cfg.levels
+        base_capital_per_grid = grid_cfg.capital_per_grid_pct
         
         # Get volatility-adjusted parameters if volatility manager is provided
         if volatility_manager:
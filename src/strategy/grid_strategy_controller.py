@@ -7,7 +7,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from analytics.cycle_tracker import CycleTracker
 from strategy.volatility_manager import VolatilityManager
-from strategy.grid_generator import GridGenerator
+from strategy.grid_generator import GridGenerator, GridLevels
 from strategy.order_executor import OrderExecutor
 from strategy.grid_display import GridDisplay
 from analytics.volume_filter import VolumeFilter
@@ -29,16 +29,18 @@ class GridStrategyController:
         self.client = client
 
         # Load grid/trailing parameters from config
-        grid_cfg = self.cfg.get_grid_config()
-        # Read directly from YAML - defaults match strategy_config.yaml exactly
-        self.trailing_enabled = grid_cfg.get("trailing_enabled", True)
-        self.trailing_direction = grid_cfg.get("trailing_direction", "both")
-        self.trailing_threshold_pct = grid_cfg.get("trailing_threshold_pct", 0.75) / 100
-        self.trailing_ma_period = grid_cfg.get("trailing_ma_period", 20)
+        grid_cfg = self.cfg.grid
+        # Frozen record built from the YAML - defaults match strategy_config.yaml exactly
+        self.trailing_enabled = grid_cfg.trailing_enabled
+        self.trailing_direction = grid_cfg.trailing_direction
+        self.trailing_threshold_pct = grid_cfg.trailing_threshold_pct / 100
+        self.trailing_ma_period = grid_cfg.trailing_ma_period
 
         # Restore or initialize state
         st = self.state.get_strategy_status()
         self.grid_levels = st.get("grid_levels", [])
+        self._grid_arrays = None
+        self._grid_arrays_src = None
         self.current_regime = st.get("current_regime", None)
         self.regime_strength_history = st.get("regime_strength_history", [])
         self.grid_generated = st.get("grid_generated", False)
@@ -47,9 +49,9 @@ class GridStrategyController:
         self.capital_per_grid = 0.0
         
         # Additional grid settings from YAML
-        self.total_capital_usage_pct = grid_cfg.get("total_capital_usage_pct", 100.0) / 100
-        self.rebalance_threshold_pct = grid_cfg.get("rebalance_threshold_pct", 2.0) / 100
-        self.auto_rebalance = grid_cfg.get("auto_rebalance", True)
+        self.total_capital_usage_pct = grid_cfg.total_capital_usage_pct / 100
+        self.rebalance_threshold_pct = grid_cfg.rebalance_threshold_pct / 100
+        self.auto_rebalance = grid_cfg.auto_rebalance
         
         # Initialize components
         self.cycle_tracker = CycleTracker(self.logger, self.cfg)
@@ -59,6 +61,8 @@ class GridStrategyController:
         self.order_executor = OrderExecutor(self.cfg, self.logger, self.pm, self.client, self.risk)
         # Pass fee calculator to order executor after initialization
         self.order_executor.fee_calculator = self.fee_calculator
+        if self.grid_levels:
+            self.fee_calculator.set_grid(self.grid_levels)
         self.grid_display = GridDisplay(self.cfg)
         self.volume_filter = VolumeFilter(self.cfg, self.logger, self.client)
         self.technical_indicators = TechnicalIndicators(self.cfg, self.logger)
@@ -84,8 +88,7 @@ class GridStrategyController:
     
     def generate_grid_levels(self, current_price):
         """Simple method to generate grid levels for dashboard display."""
-        grid_cfg = self.cfg.get_grid_config()
-        grid_spacing_pct = grid_cfg.get('grid_spacing_pct', 0.5) / 100
+        grid_spacing_pct = self.cfg.grid.grid_spacing_pct / 100
         
         # Apply volatility adjustments if available
         if hasattr(self, 'adjusted_capital_per_grid'):
@@ -108,7 +111,9 @@ class GridStrategyController:
         center_price = adjusted_params['center_price']
         grid_spacing_pct = adjusted_params['grid_spacing_pct']
         
-        grid_levels = self.grid_generator.generate_grid_levels(center_price, grid_spacing_pct)
+        # Generated already sorted by price (lowest to highest)
+        grid_arrays = self.grid_generator.generate_grid_arrays(center_price, grid_spacing_pct)
+        grid_levels = grid_arrays.as_dicts()
         
         # Add quantity to each level - use config base_order_quantity
         trading_cfg = self.cfg.get_trading_config()
@@ -116,30 +121,38 @@ class GridStrategyController:
         for level in grid_levels:
             level['quantity'] = base_quantity
         
-        # Sort by price (lowest to highest)
-        grid_levels.sort(key=lambda x: x['price'])
         self.grid_levels = grid_levels
+        self._grid_arrays, self._grid_arrays_src = grid_arrays, grid_levels
+        self.fee_calculator.set_grid(grid_levels)
         
         # Print current grid levels to console
-        self.grid_display.print_grid_levels(grid_levels, center_price)
+        self.grid_display.print_grid_levels(self.grid_arrays, center_price)
         
         return grid_levels
 
+    @property
+    def grid_arrays(self):
+        """Array view of grid_levels for vectorized scans; rebuilt when grid_levels is replaced."""
+        if self._grid_arrays_src is not self.grid_levels:
+            self._grid_arrays = GridLevels.from_dicts(self.grid_levels)
+            self._grid_arrays_src = self.grid_levels
+        return self._grid_arrays
+
     def print_grid_levels(self, current_price):
         """Print current grid levels in a clean table format."""
-        self.grid_display.print_grid_levels(self.grid_levels, current_price)
+        self.grid_display.print_grid_levels(self.grid_arrays, current_price)
 
     def print_trade_update(self, executed_level, side, current_price):
         """Print a compact update showing which level was executed and remaining levels."""
         current_position = self.pm.get_position_summary().get('current_position')
         self.grid_display.print_trade_update(
-            executed_level, side, current_price, self.grid_levels,
+            executed_level, side, current_price, self.grid_arrays,
             self.order_executor.bought_levels, self.order_executor.sold_levels, current_position
         )
 
     def print_compact_grid_status(self, current_price):
         """Print a compact grid status showing only the nearest levels."""
-        self.grid_display.print_compact_grid_status(self.grid_levels, current_price)
+        self.grid_display.print_compact_grid_status(self.grid_arrays, current_price)
 
     def calculate_order_quantity(self, price):
         """Calculate order quantity based on volatility-adjusted capital allocation per grid."""
@@ -147,8 +160,7 @@ class GridStrategyController:
         if hasattr(self, 'adjusted_capital_per_grid'):
             capital_per_grid_pct = self.adjusted_capital_per_grid / 100
         else:
-            grid_cfg = self.cfg.get_grid_config()
-            capital_per_grid_pct = grid_cfg.get('capital_per_grid_pct', 10.0) / 100
+            capital_per_grid_pct = self.cfg.grid.capital_per_grid_pct / 100
         
         if self.total_capital == 0:
             try:
@@ -179,8 +191,7 @@ class GridStrategyController:
                 self.logger.log_error(f"Failed to initialize capital - stopping bot", {"error": str(e)})
                 raise Exception(f"Cannot access account balance for capital initialization: {e}. Bot stopped for safety.")
         
-        grid_cfg = self.cfg.get_grid_config()
-        capital_per_grid_pct = grid_cfg.get('capital_per_grid_pct', 10.0) / 100
+        capital_per_grid_pct = self.cfg.grid.capital_per_grid_pct / 100
         self.capital_per_grid = self.total_capital * capital_per_grid_pct
         
         self.logger.log_signal("capital_initialized", {
@@ -568,7 +579,7 @@ class GridStrategyController:
                 
                 # 5. Active orders status
                 self.grid_display.print_active_orders_status(
-                    self.grid_levels, 
+                    self.grid_arrays, 
                     self.order_executor.bought_levels, 
                     self.order_executor.sold_levels
                 )
@@ -595,6 +606,8 @@ class GridStrategyController:
                 self.grid_display.print_fee_analysis(self.fee_calculator)
                 
                 # 10. Next action indicator
+                self.pm.flush_trades(force=True)
+                self.order_executor.trade_persistence.flush()
                 elapsed_time = (datetime.now() - start_time).total_seconds()
                 print(f"\n⏱️  Cycle completed in {elapsed_time:.2f}s")
                 print(f"⏳ Next check in {poll_interval}s...")
@@ -610,9 +623,11 @@ class GridStrategyController:
                 print(f"\r🔄 Waking up for next cycle...              ")
                 
             except KeyboardInterrupt:
+                self.pm.flush_trades(force=True)
                 print(f"\n\n⏹️  Trading stopped by user")
                 break
             except Exception as e:
+                self.pm.flush_trades(force=True)
                 print(f"❌ Error in polling cycle: {e}")
                 print(f"   Continuing in {poll_interval}s...")
                 time.sleep(poll_interval)
@@ -624,10 +639,10 @@ class GridStrategyController:
         
         # Show strategy configuration
         trading_cfg = self.cfg.get_trading_config()
-        grid_cfg = self.cfg.get_grid_config()
+        grid_cfg = self.cfg.grid
         print(f"📊 Trading Symbol: {trading_cfg.get('symbol', 'BTCUSDT')}")
-        print(f"🏗️  Grid Levels: {grid_cfg.get('levels', 10)}")
-        print(f"📈 Grid Range: ±{grid_cfg.get('grid_range_pct', 2.5)}%")
+        print(f"🏗️  Grid Levels: {grid_cfg.levels}")
+        print(f"📈 Grid Range: ±{grid_cfg.grid_range_pct}%")
         print(f"💰 Capital per Grid: ${self.capital_per_grid:,.2f}")
         print(f"⏱️  Poll Interval: {trading_cfg.get('poll_interval', 5)}s")
         
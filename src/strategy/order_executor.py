@@ -96,8 +96,7 @@ class OrderExecutor:
                         trade_value = level['price'] * base_quantity
                         calculated_fee = 0.0
                         if hasattr(self, 'fee_calculator') and self.fee_calculator:
-                            fee_info = self.fee_calculator.calculate_order_fee(trade_value, 'LIMIT')
-                            calculated_fee = fee_info['final_fee']
+                            calculated_fee = self.fee_calculator.calculate_final_fee(trade_value, 'LIMIT')
                             # Record fee payment for tracking
                             self.fee_calculator.record_fee_payment(calculated_fee, 'USDT', 'LIMIT')
                         
@@ -209,8 +208,7 @@ class OrderExecutor:
                         trade_value = level['price'] * base_quantity
                         calculated_fee = 0.0
                         if hasattr(self, 'fee_calculator') and self.fee_calculator:
-                            fee_info = self.fee_calculator.calculate_order_fee(trade_value, 'LIMIT')
-                            calculated_fee = fee_info['final_fee']
+                            calculated_fee = self.fee_calculator.calculate_final_fee(trade_value, 'LIMIT')
                             # Record fee payment for tracking
                             self.fee_calculator.record_fee_payment(calculated_fee, 'USDT', 'LIMIT')
                             
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Test realized P&L for a position closed by a partial sell followed by a full sell"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.position.position_manager import PositionManager
+
+
+class RecordingLogger:
+    """Collects the trade batches PositionManager hands to the EventLogger."""
+
+    def __init__(self):
+        self.trades = []
+
+    def log_trades_batch(self, trades):
+        self.trades.extend(trades)
+
+
+def check(label, actual, expected):
+    if abs(actual - expected) > 1e-9:
+        raise AssertionError(f"{label}: expected {expected}, got {actual}")
+    print(f"✅ {label}: {actual:.4f}")
+
+
+print("🧪 POSITION P&L TEST")
+print("=" * 50)
+
+try:
+    pm = PositionManager(RecordingLogger())
+    pm.buy(2.0, 100.0)
+
+    print("1. Partial sell (0.5 @ 110)...")
+    pm.sell(0.5, 110.0)
+    check("Realized P&L while position is open", pm.calculate_pnl()["realized"], 0.0)
+    check("Unrealized P&L @ 120", pm.calculate_pnl(120.0)["unrealized"], 30.0)
+
+    print("2. Full sell (1.5 @ 130)...")
+    pm.sell(1.5, 130.0)
+    closed = pm.closed_positions
+    if pm.current_position is not None or len(closed) != 1:
+        raise AssertionError("position was not closed")
+    # Average exit price: (0.5 * 110 + 1.5 * 130) / 2.0
+    check("Average exit price", closed[0].sell_price, 125.0)
+    check("Closed quantity", closed[0].quantity, 2.0)
+    check("Realized P&L", pm.calculate_pnl()["realized"], 50.0)
+
+    print("\n🎉 POSITION P&L TEST PASSED!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Test that a single buffered PositionManager trade reaches the EventLogger"""
+
+import sys
+import os
+import gc
+import json
+import subprocess
+import tempfile
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from src.position import position_manager
+from src.position.position_manager import PositionManager
+
+# Run in a child interpreter: one buy, then exit without flushing explicitly
+EXIT_SCRIPT = """
+import sys
+sys.path.append({root!r})
+from src.eventlog.event_logger import EventLogger
+from src.position.position_manager import PositionManager
+pm = PositionManager(EventLogger(log_dir={log_dir!r}))
+pm.buy(0.01, 50000.0)
+"""
+
+
+class RecordingLogger:
+    """Collects the trade batches PositionManager hands to the EventLogger."""
+
+    def __init__(self):
+        self.trades = []
+
+    def log_trades_batch(self, trades):
+        self.trades.extend(trades)
+
+
+print("🧪 POSITION TRADE FLUSH TEST")
+print("=" * 50)
+
+try:
+    print("1. Controller-loop flush...")
+    logger = RecordingLogger()
+    pm = PositionManager(logger)
+    pm.buy(0.01, 50000.0)
+    if logger.trades:
+        raise AssertionError("a single trade should stay buffered until a flush")
+    pm.flush_trades(force=True)
+    if [t["side"] for t in logger.trades] != ["buy"]:
+        raise AssertionError(f"expected one buy, got {logger.trades}")
+    print("✅ Buffered trade handed to the logger")
+
+    print("2. Exit hook doesn't keep managers alive...")
+    del pm
+    gc.collect()
+    if len(position_manager._live_managers) != 0:
+        raise AssertionError("PositionManager still referenced after del")
+    print("✅ Manager released")
+
+    print("3. Buffered trade flushed at interpreter exit...")
+    with tempfile.TemporaryDirectory() as log_dir:
+        subprocess.run([sys.executable, "-c", EXIT_SCRIPT.format(root=ROOT, log_dir=log_dir)],
+                       check=True, capture_output=True)
+        with open(os.path.join(log_dir, "events.json")) as f:
+            events = [json.loads(line) for line in f if line.strip()]
+    trades = [e for e in events if e["event_type"] == "trade"]
+    if len(trades) != 1 or trades[0]["data"]["price"] != 50000.0:
+        raise AssertionError(f"expected one trade in events.json, got {trades}")
+    print("✅ Trade written to events.json")
+
+    print("\n🎉 POSITION TRADE FLUSH TEST PASSED!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)